@@ -17,6 +17,22 @@ sys.path.insert(0, str(src_path))
 
 from alpaca_bot.utils.error_handler import ErrorHandler
 
+# Operations whose circuit breakers are commonly left open after API errors
+DEFAULT_RESET_OPERATIONS = (
+    "get_quote_AAPL",
+    "get_quote_MSFT",
+    "get_quote_GOOGL",
+    "get_quote_TSLA",
+    "get_latest_quote",
+    "market_data",
+    "get_bars",
+    "get_account",
+    "get_positions",
+    "get_orders",
+    "is_market_open",
+    "get_tradable_assets",
+)
+
 def main():
     """Reset circuit breakers for the trading bot."""
     # Set up logging
@@ -37,25 +53,8 @@ def main():
             logger.info(f"  {operation}: {details}")
         
         # Reset specific operations that are commonly problematic
-        operations_to_reset = [
-            "get_quote_AAPL",
-            "get_quote_MSFT", 
-            "get_quote_GOOGL",
-            "get_quote_TSLA",
-            "get_latest_quote",
-            "market_data",
-            "get_bars",
-            "get_account",
-            "get_positions",
-            "get_orders",
-            "is_market_open",
-            "get_tradable_assets"
-        ]
-        
         logger.info("Resetting circuit breakers for quote operations...")
-        for operation in operations_to_reset:
-            error_handler.reset_error_counts(operation)
-            logger.info(f"Reset circuit breaker for: {operation}")
+        error_handler.reset_error_counts_many(DEFAULT_RESET_OPERATIONS)
         
         # Also reset all error counts if requested
         if len(sys.argv) > 1 and sys.argv[1] == "--all":
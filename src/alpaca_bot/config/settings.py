@@ -4,168 +4,312 @@ This module handles secure configuration management using environment variables
 and .env files for API keys and application settings.
 """
 
+import logging
 import os
+import re
+import stat
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple
 
-from decouple import config
+from dotenv import dotenv_values
 
+logger = logging.getLogger(__name__)
 
-class Settings:
-    """Application settings with secure configuration management."""
+# Serialises save_to_env_file() calls, which may run on worker threads
+_env_file_lock = threading.Lock()
 
-    def __init__(self) -> None:
-        """Initialize settings from environment variables."""
-        # Alpaca API Configuration
-        self.alpaca_api_key: str = config(
-            "ALPACA_API_KEY",
-            default="",
-            cast=str
-        )
-        self.alpaca_secret_key: str = config(
-            "ALPACA_SECRET_KEY",
-            default="",
-            cast=str
-        )
-        self.alpaca_base_url: str = config(
-            "ALPACA_BASE_URL",
-            default="https://paper-api.alpaca.markets",
-            cast=str
-        )
-        
-        # Trading Configuration
-        self.paper_trading: bool = config(
-            "PAPER_TRADING",
-            default=True,
-            cast=bool
-        )
-        self.enable_fractional_shares: bool = config(
-            "ENABLE_FRACTIONAL_SHARES",
-            default=True,
-            cast=bool
-        )
-        self.min_order_value: float = config(
-            "MIN_ORDER_VALUE",
-            default=1.0,
-            cast=float
-        )
+# Accepted spellings for boolean settings
+_TRUE_VALUES = frozenset({"y", "yes", "t", "true", "on", "1"})
+_FALSE_VALUES = frozenset({"n", "no", "f", "false", "off", "0", ""})
+
+# Characters that make a .env value need quoting to read back unchanged
+_NEEDS_QUOTING = re.compile(r"[\s#'\"$\\]")
+
+
+class _Field(NamedTuple):
+    """Declarative description of a single setting.
+    
+    Attributes:
+        attr: Attribute name on the Settings instance.
+        env_key: Environment variable / .env key.
+        default: Value used when the variable is not set.
+        cast: Type the raw string is converted to.
+        section: .env section the value is saved under, or None if the
+            setting is not written back by save_to_env_file().
+        lazy: Whether the value is only read from the environment the first
+            time it is accessed.
+    """
+    
+    attr: str
+    env_key: str
+    default: Any
+    cast: Callable
+    section: Optional[str]
+    lazy: bool = False
+
+
+# .env section titles, in the order save_to_env_file() writes them
+_SECTION_TITLES = {
+    "api": "Alpaca API Settings",
+    "trading": "Trading Configuration",
+    "position": "Position Sizing Features",
+    "app": "Application Settings",
+    "gui": "GUI Settings",
+}
+
+
+# Settings exposed through Settings.get_strategy_params()
+_STRATEGY_PARAM_NAMES = (
+    "support_threshold",
+    "resistance_threshold",
+    "stop_loss_percentage",
+    "default_position_size",
+)
+
+
+def _require(value: str, name: str) -> None:
+    """Check that a required setting is set.
+    
+    Args:
+        value: Setting value.
+        name: Setting name used in the error message.
         
-        # Dynamic parameter adjustment
-        self.enable_dynamic_parameters: bool = config(
-            "ENABLE_DYNAMIC_PARAMETERS",
-            default=True,
-            cast=bool
-        )
-        self.parameter_refresh_frequency: int = config(
-            "PARAMETER_REFRESH_FREQUENCY",
-            default=10,
-            cast=int
+    Raises:
+        ValueError: If the value is empty.
+    """
+    if not value:
+        raise ValueError(
+            f"{name} is required. Please set it in your environment "
+            "variables or .env file."
         )
+
+
+def _check_unit_open(value: float, name: str) -> None:
+    """Check that a value lies in the open interval (0, 1).
+    
+    Args:
+        value: Value to check.
+        name: Setting name used in the error message.
         
-        # Strategy Parameters
-        self.default_position_size: float = config(
-            "DEFAULT_POSITION_SIZE",
-            default=1000.0,
-            cast=float
-        )
-        self.support_threshold: float = config(
-            "SUPPORT_THRESHOLD",
-            default=0.02,
-            cast=float
-        )
-        self.resistance_threshold: float = config(
-            "RESISTANCE_THRESHOLD",
-            default=0.015,
-            cast=float
-        )
-        self.stop_loss_percentage: float = config(
-            "STOP_LOSS_PERCENTAGE",
-            default=0.01,
-            cast=float
-        )
+    Raises:
+        ValueError: If the value is not between 0 and 1 (exclusive).
+    """
+    if value <= 0 or value >= 1:
+        raise ValueError(f"{name} must be between 0 and 1 (exclusive).")
+
+
+# Checks run by update_strategy_params() for the parameters that have one
+_VALIDATORS: Dict[str, Callable[[Any, str], None]] = {
+    "support_threshold": _check_unit_open,
+    "resistance_threshold": _check_unit_open,
+    "stop_loss_percentage": _check_unit_open,
+}
+
+
+class _StrategyParamsView(Mapping[str, float]):
+    """Read-only mapping of the strategy parameters of a Settings instance.
+    
+    Values are looked up on the settings on every access, so the view stays
+    current however the attributes are changed.
+    """
+    
+    __slots__ = ("_settings",)
+    
+    def __init__(self, settings: "Settings") -> None:
+        """Initialize _StrategyParamsView.
         
-        # Fixed Trade Amount Feature
-        self.fixed_trade_amount_enabled: bool = config(
+        Args:
+            settings: Settings instance the parameters are read from.
+        """
+        self._settings = settings
+    
+    def __getitem__(self, name: str) -> float:
+        if name not in _STRATEGY_PARAM_NAMES:
+            raise KeyError(name)
+        return getattr(self._settings, name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STRATEGY_PARAM_NAMES)
+    
+    def __len__(self) -> int:
+        return len(_STRATEGY_PARAM_NAMES)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class Settings:
+    """Application settings with secure configuration management."""
+    
+    # Alpaca API Configuration
+    alpaca_api_key: str
+    alpaca_secret_key: str
+    alpaca_base_url: str
+    paper_trading: bool
+    
+    # Trading Configuration
+    enable_fractional_shares: bool
+    min_order_value: float
+    enable_dynamic_parameters: bool
+    parameter_refresh_frequency: int
+    
+    # Strategy Parameters
+    trading_mode: str
+    support_threshold: float
+    resistance_threshold: float
+    stop_loss_percentage: float
+    default_position_size: float
+    
+    # Fixed Trade Amount Feature
+    fixed_trade_amount_enabled: bool
+    fixed_trade_amount: float
+    min_trade_amount: float
+    max_trade_amount: float
+    
+    # Portfolio Management
+    custom_portfolio_value_enabled: bool
+    custom_portfolio_value: float
+    min_portfolio_value: float
+    max_portfolio_value: float
+    
+    # Application Configuration
+    log_level: str
+    log_file_path: str
+    data_refresh_interval: int
+    
+    # GUI Configuration
+    window_width: int
+    window_height: int
+    
+    # Every setting loaded from the environment, grouped in .env save order
+    _FIELDS: Tuple[_Field, ...] = (
+        _Field("alpaca_api_key", "ALPACA_API_KEY", "", str, "api"),
+        _Field("alpaca_secret_key", "ALPACA_SECRET_KEY", "", str, "api"),
+        _Field(
+            "alpaca_base_url",
+            "ALPACA_BASE_URL",
+            "https://paper-api.alpaca.markets",
+            str,
+            "api",
+        ),
+        _Field("paper_trading", "PAPER_TRADING", True, bool, "api"),
+        _Field("trading_mode", "TRADING_MODE", "conservative", str, "trading"),
+        _Field("support_threshold", "SUPPORT_THRESHOLD", 0.02, float, "trading"),
+        _Field(
+            "resistance_threshold", "RESISTANCE_THRESHOLD", 0.015, float, "trading"
+        ),
+        _Field(
+            "stop_loss_percentage", "STOP_LOSS_PERCENTAGE", 0.01, float, "trading"
+        ),
+        _Field(
+            "default_position_size", "DEFAULT_POSITION_SIZE", 1000.0, float, "trading"
+        ),
+        _Field(
+            "fixed_trade_amount_enabled",
             "FIXED_TRADE_AMOUNT_ENABLED",
-            default=False,
-            cast=bool
-        )
-        self.fixed_trade_amount: float = config(
-            "FIXED_TRADE_AMOUNT",
-            default=100.0,
-            cast=float
-        )
-        self.min_trade_amount: float = config(
-            "MIN_TRADE_AMOUNT",
-            default=1.0,
-            cast=float
-        )
-        self.max_trade_amount: float = config(
-            "MAX_TRADE_AMOUNT",
-            default=10000.0,
-            cast=float
-        )
-        
-        # Trading Mode
-        self.trading_mode: str = config(
-            "TRADING_MODE",
-            default="conservative",
-            cast=str
-        )
-        
-        # Portfolio Management
-        self.custom_portfolio_value_enabled: bool = config(
+            False,
+            bool,
+            "position",
+        ),
+        _Field("fixed_trade_amount", "FIXED_TRADE_AMOUNT", 100.0, float, "position"),
+        _Field(
+            "custom_portfolio_value_enabled",
             "CUSTOM_PORTFOLIO_VALUE_ENABLED",
-            default=False,
-            cast=bool
-        )
-        self.custom_portfolio_value: float = config(
+            False,
+            bool,
+            "position",
+        ),
+        _Field(
+            "custom_portfolio_value",
             "CUSTOM_PORTFOLIO_VALUE",
-            default=10000.0,
-            cast=float
-        )
-        self.min_portfolio_value: float = config(
-            "MIN_PORTFOLIO_VALUE",
-            default=1.0,
-            cast=float
-        )
-        self.max_portfolio_value: float = config(
-            "MAX_PORTFOLIO_VALUE",
-            default=1000000.0,
-            cast=float
-        )
-        
-        # Application Configuration
-        self.log_level: str = config(
-            "LOG_LEVEL",
-            default="INFO",
-            cast=str
-        )
-        self.log_file_path: str = config(
+            10000.0,
+            float,
+            "position",
+        ),
+        _Field("log_level", "LOG_LEVEL", "INFO", str, "app"),
+        _Field(
+            "log_file_path",
             "LOG_FILE_PATH",
-            default="logs/alpaca_bot.log",
-            cast=str
-        )
-        self.data_refresh_interval: int = config(
-            "DATA_REFRESH_INTERVAL",
-            default=5,
-            cast=int
-        )
+            "logs/alpaca_bot.log",
+            str,
+            "app",
+            lazy=True,
+        ),
+        _Field(
+            "data_refresh_interval", "DATA_REFRESH_INTERVAL", 5, int, "app", lazy=True
+        ),
+        _Field("window_width", "WINDOW_WIDTH", 1200, int, "gui", lazy=True),
+        _Field("window_height", "WINDOW_HEIGHT", 800, int, "gui", lazy=True),
+        # Not written back by save_to_env_file()
+        _Field(
+            "enable_fractional_shares", "ENABLE_FRACTIONAL_SHARES", True, bool, None
+        ),
+        _Field("min_order_value", "MIN_ORDER_VALUE", 1.0, float, None),
+        _Field(
+            "enable_dynamic_parameters", "ENABLE_DYNAMIC_PARAMETERS", True, bool, None
+        ),
+        _Field(
+            "parameter_refresh_frequency", "PARAMETER_REFRESH_FREQUENCY", 10, int, None
+        ),
+        _Field("min_trade_amount", "MIN_TRADE_AMOUNT", 1.0, float, None),
+        _Field("max_trade_amount", "MAX_TRADE_AMOUNT", 10000.0, float, None),
+        _Field("min_portfolio_value", "MIN_PORTFOLIO_VALUE", 1.0, float, None),
+        _Field("max_portfolio_value", "MAX_PORTFOLIO_VALUE", 1000000.0, float, None),
+    )
+    
+    # Fields resolved on first access by __getattr__, keyed by attribute
+    _LAZY_FIELDS: Dict[str, _Field] = {
+        field.attr: field for field in _FIELDS if field.lazy
+    }
+    
+    # Fixed attributes live in slots; "__dict__" is kept so callers such as
+    # the config panel can still attach extra settings at runtime
+    __slots__ = tuple(field.attr for field in _FIELDS) + (
+        "_strategy_view",
+        "_env_cache",
+        "__dict__",
+    )
+
+    def __init__(self) -> None:
+        """Initialize settings from environment variables."""
+        # (path, mtime_ns, variables) of the last .env file read or written
+        self._env_cache: Optional[Tuple[Path, int, Dict[str, str]]] = None
         
-        # GUI Configuration
-        self.window_width: int = config(
-            "WINDOW_WIDTH",
-            default=1200,
-            cast=int
-        )
-        self.window_height: int = config(
-            "WINDOW_HEIGHT",
-            default=800,
-            cast=int
-        )
+        # Lazy fields are read from the environment on first access
+        for field in self._FIELDS:
+            if not field.lazy:
+                setattr(
+                    self, field.attr, _get(field.env_key, field.default, field.cast)
+                )
         
         # Validate critical settings
         self._validate_settings()
+        
+        # Read-only view handed out by get_strategy_params()
+        self._strategy_view: Mapping[str, float] = _StrategyParamsView(self)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Load a lazy field from the environment on first access.
+        
+        Args:
+            name: Attribute name.
+            
+        Returns:
+            Any: The setting value.
+            
+        Raises:
+            AttributeError: If name is not a lazy field.
+        """
+        field = self._LAZY_FIELDS.get(name)
+        if field is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        value = _get(field.env_key, field.default, field.cast)
+        setattr(self, name, value)
+        return value
     
     def _validate_settings(self) -> None:
         """Validate critical configuration settings.
@@ -173,32 +317,33 @@ class Settings:
         Raises:
             ValueError: If required settings are missing or invalid.
         """
-        if not self.alpaca_api_key:
-            raise ValueError(
-                "ALPACA_API_KEY is required. Please set it in your environment "
-                "variables or .env file."
-            )
-        
-        if not self.alpaca_secret_key:
-            raise ValueError(
-                "ALPACA_SECRET_KEY is required. Please set it in your environment "
-                "variables or .env file."
-            )
+        _require(self.alpaca_api_key, "ALPACA_API_KEY")
+        _require(self.alpaca_secret_key, "ALPACA_SECRET_KEY")
+        _check_unit_open(self.support_threshold, "SUPPORT_THRESHOLD")
+        _check_unit_open(self.resistance_threshold, "RESISTANCE_THRESHOLD")
+        _check_unit_open(self.stop_loss_percentage, "STOP_LOSS_PERCENTAGE")
+    
+    def reload(self) -> None:
+        """Re-read settings from the .env file and environment.
         
-        if self.support_threshold <= 0 or self.support_threshold >= 1:
-            raise ValueError(
-                "SUPPORT_THRESHOLD must be between 0 and 1 (exclusive)."
-            )
+        The new values are loaded and validated on a separate instance
+        first, so an invalid .env file leaves these settings unchanged.
         
-        if self.resistance_threshold <= 0 or self.resistance_threshold >= 1:
-            raise ValueError(
-                "RESISTANCE_THRESHOLD must be between 0 and 1 (exclusive)."
-            )
+        Raises:
+            ValueError: If the reloaded settings are missing or invalid.
+        """
+        _load_env_file_values.cache_clear()
+        fresh = Settings()
         
-        if self.stop_loss_percentage <= 0 or self.stop_loss_percentage >= 1:
-            raise ValueError(
-                "STOP_LOSS_PERCENTAGE must be between 0 and 1 (exclusive)."
-            )
+        for field in self._FIELDS:
+            if field.lazy:
+                # Drop any value already loaded; re-read on next access
+                try:
+                    delattr(self, field.attr)
+                except AttributeError:
+                    pass
+            else:
+                setattr(self, field.attr, getattr(fresh, field.attr))
     
     def is_paper_trading(self) -> bool:
         """Check if paper trading is enabled.
@@ -214,141 +359,310 @@ class Settings:
         Returns:
             tuple[str, str, str]: API key, secret key, and base URL.
         """
-        return self.alpaca_api_key, self.alpaca_secret_key, self.alpaca_base_url
+        return (self.alpaca_api_key, self.alpaca_secret_key, self.alpaca_base_url)
     
-    def get_strategy_params(self) -> dict[str, float]:
+    def get_strategy_params(self) -> Mapping[str, float]:
         """Get trading strategy parameters.
         
+        The returned mapping is a read-only view that reflects the current
+        attribute values, however they are changed.
+        
         Returns:
-            dict[str, float]: Dictionary containing strategy parameters.
+            Mapping[str, float]: Read-only mapping of strategy parameters.
         """
-        return {
-            "support_threshold": self.support_threshold,
-            "resistance_threshold": self.resistance_threshold,
-            "stop_loss_percentage": self.stop_loss_percentage,
-            "default_position_size": self.default_position_size,
-        }
+        return self._strategy_view
     
     def update_strategy_params(self, **kwargs) -> None:
         """Update strategy parameters.
         
+        Only the parameters being changed are validated. Every value is
+        checked before any is applied, so a rejected call changes nothing.
+        
         Args:
             **kwargs: Strategy parameters to update.
+            
+        Raises:
+            ValueError: If an updated parameter is invalid.
         """
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        updates = {key: value for key, value in kwargs.items() if hasattr(self, key)}
+        for key, value in updates.items():
+            validator = _VALIDATORS.get(key)
+            if validator is not None:
+                validator(value, key.upper())
         
-        # Re-validate after updates
-        self._validate_settings()
+        for key, value in updates.items():
+            setattr(self, key, value)
+    
+    def _read_env_file(self, env_file_path: Path) -> Dict[str, str]:
+        """Read variables from an existing .env file.
+        
+        The parsed variables are cached on the instance and only re-read when
+        the file's path or modification time changes.
+        
+        Args:
+            env_file_path (Path): Path to the .env file.
+            
+        Returns:
+            Dict[str, str]: Variables from the file; empty if it doesn't exist.
+        """
+        try:
+            mtime = env_file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        cache = self._env_cache
+        if cache is not None and cache[0] == env_file_path and cache[1] == mtime:
+            return dict(cache[2])
+        
+        # Keys declared without a value parse as None; skip them. Variables
+        # are not expanded, so references like ${HOME} are written back as is
+        env_vars = {
+            key: value
+            for key, value in dotenv_values(env_file_path, interpolate=False).items()
+            if value is not None
+        }
+        
+        self._env_cache = (env_file_path, mtime, env_vars)
+        return dict(env_vars)
+    
+    def env_file_values(self) -> Dict[str, str]:
+        """Format the settings written by save_to_env_file().
+        
+        Returns:
+            Dict[str, str]: .env values keyed by variable name.
+        """
+        return {
+            field.env_key: _format_env_value(getattr(self, field.attr))
+            for field in self._FIELDS
+            if field.section is not None
+        }
     
-    def save_to_env_file(self, env_file_path: str = None) -> bool:
+    def save_to_env_file(
+        self,
+        env_file_path: str = None,
+        values: Optional[Mapping[str, str]] = None,
+    ) -> bool:
         """Save current settings to .env file.
         
+        Saves are serialised, and the file is written next to the target and
+        then renamed over it, so concurrent or failed saves never leave a
+        truncated file behind.
+        
         Args:
             env_file_path (str, optional): Path to .env file. Defaults to project root/.env
+            values (Mapping[str, str], optional): Values from env_file_values()
+                to write. Defaults to the current settings; pass a snapshot
+                taken beforehand when saving from another thread.
             
         Returns:
             bool: True if saved successfully, False otherwise.
         """
+        if values is None:
+            values = self.env_file_values()
+        
         try:
             if env_file_path is None:
                 env_file_path = get_project_root() / ".env"
             else:
                 env_file_path = Path(env_file_path)
             
-            # Read existing .env file if it exists
-            existing_vars = {}
-            if env_file_path.exists():
-                with open(env_file_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            existing_vars[key.strip()] = value.strip()
-            
-            # Update with current settings
-            settings_to_save = {
-                # Alpaca API Settings
-                'ALPACA_API_KEY': self.alpaca_api_key,
-                'ALPACA_SECRET_KEY': self.alpaca_secret_key,
-                'ALPACA_BASE_URL': self.alpaca_base_url,
-                'PAPER_TRADING': str(self.paper_trading).lower(),
-                
-                # Trading Configuration
-                'TRADING_MODE': self.trading_mode,
-                'SUPPORT_THRESHOLD': str(self.support_threshold),
-                'RESISTANCE_THRESHOLD': str(self.resistance_threshold),
-                'STOP_LOSS_PERCENTAGE': str(self.stop_loss_percentage),
-                'DEFAULT_POSITION_SIZE': str(self.default_position_size),
-                
-                # Fixed Trade Amount Feature
-                'FIXED_TRADE_AMOUNT_ENABLED': str(self.fixed_trade_amount_enabled).lower(),
-                'FIXED_TRADE_AMOUNT': str(self.fixed_trade_amount),
-                
-                # Custom Portfolio Value Feature
-                'CUSTOM_PORTFOLIO_VALUE_ENABLED': str(self.custom_portfolio_value_enabled).lower(),
-                'CUSTOM_PORTFOLIO_VALUE': str(self.custom_portfolio_value),
-                
-                # Application Settings
-                'LOG_LEVEL': self.log_level,
-                'LOG_FILE_PATH': self.log_file_path,
-                'DATA_REFRESH_INTERVAL': str(self.data_refresh_interval),
-                
-                # GUI Settings
-                'WINDOW_WIDTH': str(self.window_width),
-                'WINDOW_HEIGHT': str(self.window_height),
-            }
-            
-            # Merge with existing variables (preserve non-settings variables)
-            existing_vars.update(settings_to_save)
-            
-            # Write to .env file
-            with open(env_file_path, 'w') as f:
-                f.write("# Alpaca Trading Bot Configuration\n")
-                f.write("# Generated automatically - modify with caution\n\n")
-                
-                # Group settings by category
-                f.write("# Alpaca API Settings\n")
-                for key in ['ALPACA_API_KEY', 'ALPACA_SECRET_KEY', 'ALPACA_BASE_URL', 'PAPER_TRADING']:
-                    if key in existing_vars:
-                        f.write(f"{key}={existing_vars[key]}\n")
-                
-                f.write("\n# Trading Configuration\n")
-                for key in ['TRADING_MODE', 'SUPPORT_THRESHOLD', 'RESISTANCE_THRESHOLD', 'STOP_LOSS_PERCENTAGE', 'DEFAULT_POSITION_SIZE']:
-                    if key in existing_vars:
-                        f.write(f"{key}={existing_vars[key]}\n")
-                
-                f.write("\n# Position Sizing Features\n")
-                for key in ['FIXED_TRADE_AMOUNT_ENABLED', 'FIXED_TRADE_AMOUNT', 'CUSTOM_PORTFOLIO_VALUE_ENABLED', 'CUSTOM_PORTFOLIO_VALUE']:
-                    if key in existing_vars:
-                        f.write(f"{key}={existing_vars[key]}\n")
-                
-                f.write("\n# Application Settings\n")
-                for key in ['LOG_LEVEL', 'LOG_FILE_PATH', 'DATA_REFRESH_INTERVAL']:
-                    if key in existing_vars:
-                        f.write(f"{key}={existing_vars[key]}\n")
-                
-                f.write("\n# GUI Settings\n")
-                for key in ['WINDOW_WIDTH', 'WINDOW_HEIGHT']:
-                    if key in existing_vars:
-                        f.write(f"{key}={existing_vars[key]}\n")
-                
-                # Write any other existing variables
-                other_vars = {k: v for k, v in existing_vars.items() 
-                             if k not in settings_to_save}
-                if other_vars:
-                    f.write("\n# Other Settings\n")
-                    for key, value in other_vars.items():
-                        f.write(f"{key}={value}\n")
+            # Write through a symlinked .env to its target rather than
+            # replacing the link with a regular file
+            env_file_path = env_file_path.resolve()
             
+            with _env_file_lock:
+                self._write_env_file(env_file_path, values)
             return True
             
-        except Exception as e:
-            print(f"Error saving settings to .env file: {e}")
+        except (OSError, ValueError) as e:
+            # ValueError covers a .env file that is not valid UTF-8
+            logger.error(f"Error saving settings to .env file: {e}")
             return False
+    
+    def _write_env_file(self, env_file_path: Path, values: Mapping[str, str]) -> None:
+        """Merge values into the .env file and write it atomically.
+        
+        Args:
+            env_file_path (Path): Path to the .env file.
+            values (Mapping[str, str]): Settings to write.
+            
+        Raises:
+            OSError: If the file cannot be read or written.
+            ValueError: If the existing file is not valid UTF-8.
+        """
+        # Read existing .env file if it exists
+        existing_vars = self._read_env_file(env_file_path)
+        
+        # Update with current settings
+        settings_to_save = dict(values)
+        
+        # Merge with existing variables (preserve non-settings variables)
+        existing_vars.update(settings_to_save)
+        
+        # Build the file contents, grouped by section
+        parts = [
+            "# Alpaca Trading Bot Configuration\n",
+            "# Generated automatically - modify with caution\n",
+        ]
+        for header, keys in _SECTIONS:
+            parts.append(header)
+            parts.extend(
+                f"{key}={_quote_env_value(existing_vars[key])}\n"
+                for key in keys
+                if key in existing_vars
+            )
+        
+        # Append any other existing variables
+        other_vars = {k: v for k, v in existing_vars.items() 
+                     if k not in settings_to_save}
+        if other_vars:
+            parts.append("\n# Other Settings\n")
+            parts.extend(
+                f"{key}={_quote_env_value(value)}\n" for key, value in other_vars.items()
+            )
+        
+        # Keep the permissions of the existing file (it holds the API
+        # secret); a new file is only readable by its owner
+        try:
+            mode = stat.S_IMODE(env_file_path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+        
+        # Write next to the target and rename, so the file is never truncated
+        tmp_path = Path(f"{env_file_path}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, env_file_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        # The file now holds exactly existing_vars; remember that
+        self._env_cache = (
+            env_file_path,
+            env_file_path.stat().st_mtime_ns,
+            existing_vars,
+        )
+        
+        # Later lookups should see the values just written
+        _load_env_file_values.cache_clear()
+
+
+# (section header, .env keys) pairs written by save_to_env_file(), in order
+_SECTIONS = tuple(
+    (
+        f"\n# {title}\n",
+        tuple(
+            field.env_key for field in Settings._FIELDS if field.section == section
+        ),
+    )
+    for section, title in _SECTION_TITLES.items()
+)
+
+
+@lru_cache(maxsize=1)
+def _load_env_file_values() -> Dict[str, str]:
+    """Read the project .env file.
+    
+    The result is cached so the file is parsed once per process rather than
+    once per setting; call ``_load_env_file_values.cache_clear()`` after the
+    file changes. Only the file is cached: _get() checks the process
+    environment on every lookup, so later Settings() see environment changes.
+    
+    Returns:
+        Dict[str, str]: Variables from the .env file; empty if it doesn't exist.
+    """
+    env_file_path = get_project_root() / ".env"
+    if not env_file_path.exists():
+        return {}
+    # Keys declared without a value parse as None; skip them
+    return {
+        key: value
+        for key, value in dotenv_values(env_file_path).items()
+        if value is not None
+    }
+
 
+def _to_bool(raw: str) -> bool:
+    """Convert a configuration string to a boolean.
+    
+    Args:
+        raw: Raw value such as "true", "False", "1" or "off".
+        
+    Returns:
+        bool: The parsed value.
+        
+    Raises:
+        ValueError: If the string is not a recognised boolean.
+    """
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {raw!r}")
+
+
+def _get(name: str, default: Any, cast: Callable) -> Any:
+    """Look up a configuration value and convert it to the requested type.
+    
+    Process environment variables take precedence over the .env file.
+    
+    Args:
+        name: Environment variable name.
+        default: Value returned when the variable is not set.
+        cast: Type to convert the raw string to.
+        
+    Returns:
+        Any: The converted value, or the default if the variable is unset.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        raw = _load_env_file_values().get(name)
+    if raw is None:
+        return default
+    if cast is bool:
+        return _to_bool(raw)
+    return cast(raw)
 
+
+def _format_env_value(value: Any) -> str:
+    """Format a setting value for writing to a .env file.
+    
+    Args:
+        value: Setting value.
+        
+    Returns:
+        str: The value as a string, with booleans lower-cased.
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _quote_env_value(value: str) -> str:
+    """Quote a value for a .env line so it parses back unchanged.
+    
+    Values containing whitespace, "#", quotes, "$" or backslashes are
+    single-quoted with backslashes and single quotes escaped; others are
+    written bare.
+    
+    Args:
+        value: Raw value.
+        
+    Returns:
+        str: The value as it should appear after "KEY=".
+    """
+    if not _NEEDS_QUOTING.search(value):
+        return value
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory.
     
@@ -358,18 +672,42 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent.parent
 
 
+@lru_cache(maxsize=1)
 def ensure_directories() -> None:
-    """Ensure required directories exist."""
+    """Ensure required directories exist.
+    
+    The check runs once per process; later calls return immediately.
+    """
     project_root = get_project_root()
     
-    # Create logs directory if it doesn't exist
-    logs_dir = project_root / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    # Create logs and data directories if they don't exist
+    for directory in (project_root / "logs", project_root / "data"):
+        if not directory.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared settings instance, creating it on first use.
+    
+    Deferring construction keeps importing this module free of side effects:
+    the .env file is only read and validated when settings are needed.
     
-    # Create data directory if it doesn't exist
-    data_dir = project_root / "data"
-    data_dir.mkdir(exist_ok=True)
+    Returns:
+        Settings: The process-wide settings instance.
+        
+    Raises:
+        ValueError: If required settings are missing or invalid.
+    """
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level ``settings`` attribute lazily.
+    
+    Code that still does ``from alpaca_bot.config.settings import settings``
+    keeps working, but new code should call get_settings() at the point of use.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
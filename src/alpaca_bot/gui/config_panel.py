@@ -7,33 +7,336 @@ This module provides:
 - Trading preferences
 """
 
-import logging
+import functools
+import re
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Any, Callable, Optional
-import json
+import weakref
+from contextlib import contextmanager
+from tkinter import ttk
+from typing import Dict, Any, Callable, Iterator, List, Mapping, Optional, Tuple, Type
 import os
 from pathlib import Path
 
 from ..utils.logging_utils import get_logger
 from ..config.settings import Settings
 
+logger = get_logger(__name__)
+
+# Text accepted as a number by the numeric entry fields
+_NUMBER_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Combobox choices
+_MODE_VALUES = ('ultra_safe', 'conservative', 'aggressive')
+_POSITION_SIZE_METHODS = ('fixed_amount', 'percent_of_portfolio', 'volatility_based')
+_CHART_TIMEFRAMES = ('1Min', '5Min', '15Min', '1Hour', '1Day')
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Configuration variables: name -> (tkinter variable type, default value)
+_VAR_SPEC: Dict[str, Tuple[Type[tk.Variable], Any]] = {
+    # Support/Resistance
+    'support_resistance_lookback': (tk.IntVar, 20),
+    'support_resistance_min_touches': (tk.IntVar, 2),
+    'support_resistance_tolerance': (tk.DoubleVar, 0.01),
+    
+    # RSI parameters
+    'rsi_period': (tk.IntVar, 14),
+    'rsi_oversold': (tk.DoubleVar, 30.0),
+    'rsi_overbought': (tk.DoubleVar, 70.0),
+    
+    # Bollinger Bands
+    'bb_period': (tk.IntVar, 20),
+    'bb_std_dev': (tk.DoubleVar, 2.0),
+    
+    # MACD parameters
+    'macd_fast': (tk.IntVar, 12),
+    'macd_slow': (tk.IntVar, 26),
+    'macd_signal': (tk.IntVar, 9),
+    
+    # Position sizing
+    'position_size_method': (tk.StringVar, 'fixed_amount'),
+    'fixed_position_amount': (tk.DoubleVar, 1000.0),
+    'position_size_percent': (tk.DoubleVar, 2.0),
+    'max_position_size': (tk.DoubleVar, 10000.0),
+    
+    # Fixed Trade Amount Feature
+    'fixed_trade_amount_enabled': (tk.BooleanVar, False),
+    'fixed_trade_amount': (tk.DoubleVar, 100.0),
+    
+    # Custom Portfolio Value Feature
+    'custom_portfolio_value_enabled': (tk.BooleanVar, False),
+    'custom_portfolio_value': (tk.DoubleVar, 10000.0),
+    
+    # Risk management
+    'stop_loss_percent': (tk.DoubleVar, 2.0),
+    'take_profit_percent': (tk.DoubleVar, 3.0),
+    'max_daily_loss': (tk.DoubleVar, 500.0),
+    'max_daily_trades': (tk.IntVar, 20),
+    'max_positions': (tk.IntVar, 5),
+    
+    # Trading hours
+    'trading_start_hour': (tk.IntVar, 9),
+    'trading_start_minute': (tk.IntVar, 30),
+    'trading_end_hour': (tk.IntVar, 15),
+    'trading_end_minute': (tk.IntVar, 30),
+    
+    # Data settings
+    'data_update_interval': (tk.IntVar, 5),
+    'chart_timeframe': (tk.StringVar, '1Min'),
+    'max_bars_history': (tk.IntVar, 1000),
+    
+    # Auto-selection criteria
+    'auto_select_enabled': (tk.BooleanVar, False),
+    'auto_select_max_symbols': (tk.IntVar, 10),
+    'auto_select_min_volume': (tk.IntVar, 1000000),
+    'auto_select_min_price': (tk.DoubleVar, 10.0),
+    'auto_select_max_price': (tk.DoubleVar, 500.0),
+    'auto_select_min_volatility': (tk.DoubleVar, 0.02),
+    
+    # Logging
+    'log_level': (tk.StringVar, 'INFO'),
+    'log_to_file': (tk.BooleanVar, True),
+    'max_log_files': (tk.IntVar, 10),
+    
+    # Trading mode
+    'trading_mode': (tk.StringVar, 'conservative'),
+}
+
+
+# Sentinel for settings attributes that don't exist yet
+_MISSING = object()
+
+# Config variables synced with settings by _load_settings/_save_settings
+_SETTINGS_VARS: Tuple[str, ...] = (
+    # Strategy parameters
+    'support_resistance_lookback',
+    'support_resistance_min_touches',
+    'support_resistance_tolerance',
+    'rsi_period',
+    'rsi_oversold',
+    'rsi_overbought',
+    'bb_period',
+    'bb_std_dev',
+    'macd_fast',
+    'macd_slow',
+    'macd_signal',
+    
+    # Position sizing
+    'position_size_method',
+    'fixed_position_amount',
+    'position_size_percent',
+    'max_position_size',
+    
+    # Fixed Trade Amount Feature
+    'fixed_trade_amount_enabled',
+    'fixed_trade_amount',
+    
+    # Custom Portfolio Value Feature
+    'custom_portfolio_value_enabled',
+    'custom_portfolio_value',
+    
+    # Risk management
+    'stop_loss_percent',
+    'take_profit_percent',
+    'max_daily_loss',
+    'max_daily_trades',
+    'max_positions',
+    
+    # Trading hours
+    'trading_start_hour',
+    'trading_start_minute',
+    'trading_end_hour',
+    'trading_end_minute',
+    
+    # Data settings
+    'data_update_interval',
+    'chart_timeframe',
+    'max_bars_history',
+    
+    # Auto-selection
+    'auto_select_enabled',
+    'auto_select_max_symbols',
+    'auto_select_min_volume',
+    'auto_select_min_price',
+    'auto_select_max_price',
+    'auto_select_min_volatility',
+    
+    # Logging
+    'log_level',
+    'log_to_file',
+    'max_log_files',
+    
+    # Trading mode
+    'trading_mode',
+)
+
+# Settings attributes named like their variable rather than in upper case
+_LOWERCASE_SETTINGS = frozenset({
+    'fixed_trade_amount_enabled', 'fixed_trade_amount',
+    'custom_portfolio_value_enabled', 'custom_portfolio_value',
+    'trading_mode',
+})
+
+# (config variable, settings attribute) pairs
+_SETTINGS_PAIRS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, name if name in _LOWERCASE_SETTINGS else name.upper())
+    for name in _SETTINGS_VARS
+)
+
+# Variables loaded from settings but not written back by _save_settings
+_LOAD_ONLY = frozenset({'custom_portfolio_value_enabled', 'custom_portfolio_value'})
+
+# config variable -> settings attribute
+_LOAD_MAPPING: Dict[str, str] = dict(_SETTINGS_PAIRS)
+
+# settings attribute -> config variable
+_SAVE_MAPPING: Dict[str, str] = {
+    setting_name: var_name
+    for var_name, setting_name in _SETTINGS_PAIRS
+    if var_name not in _LOAD_ONLY
+}
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write data to a JSON file, indented by two spaces.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    The file is written next to the target and then renamed over it, so a
+    failed write never leaves a truncated file behind.
+    
+    Args:
+        path: Output file path.
+        data: JSON-serializable data.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    tmp_path = Path(f"{path}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    
+    Args:
+        path: Input file path.
+        
+    Returns:
+        The decoded JSON data.
+    """
+    payload = Path(path).read_bytes()
+    try:
+        import orjson
+    except ImportError:
+        import json
+        
+        return json.loads(payload)
+    
+    return orjson.loads(payload)
+
+
+class _LazyVarDict(Mapping[str, tk.Variable]):
+    """Read-only mapping of configuration variables created on first access.
+    
+    Every name in the spec is a key from the start, but its tkinter variable
+    is only allocated when it is first looked up, so variables for tabs that
+    are never shown are never created.
+    """
+    
+    def __init__(self, master: tk.Misc, spec: Dict[str, Tuple[Type[tk.Variable], Any]],
+                 defaults: Optional[Dict[str, Any]] = None,
+                 on_write: Optional[Callable[..., None]] = None):
+        """Initialize _LazyVarDict.
+        
+        Args:
+            master: Widget that owns the created variables.
+            spec: Variable name to (variable type, default value).
+            defaults: Default values overriding those in the spec.
+            on_write: Called as on_write(name, *trace_args) whenever a
+                created variable is written.
+        """
+        self._master = master
+        self._on_write = on_write
+        self._spec = spec
+        self._defaults = {name: default for name, (_, default) in spec.items()}
+        if defaults:
+            self._defaults.update(defaults)
+        self._vars: Dict[str, tk.Variable] = {}
+    
+    def __getitem__(self, name: str) -> tk.Variable:
+        var = self._vars.get(name)
+        if var is None:
+            var_type = self._spec[name][0]
+            var = var_type(master=self._master, value=self._defaults[name])
+            if self._on_write is not None:
+                var.trace_add('write', functools.partial(self._on_write, name))
+            self._vars[name] = var
+        return var
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._spec
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spec)
+    
+    def __len__(self) -> int:
+        return len(self._spec)
+    
+    def get_value(self, name: str) -> Any:
+        """Get a variable's value without creating the variable.
+        
+        Args:
+            name: Variable name.
+            
+        Returns:
+            The variable's value, or its default if it hasn't been created.
+        """
+        var = self._vars.get(name)
+        if var is None:
+            return self._defaults[name]
+        return var.get()
+    
+    def reset(self) -> None:
+        """Reset every created variable to its default value."""
+        for name, var in self._vars.items():
+            var.set(self._defaults[name])
+
 
 class ConfigPanel:
     """Configuration panel for trading bot settings."""
     
+    _MODE_DESCRIPTIONS = {
+        'ultra_safe': 'Ultra-Safe: Minimal risk, very conservative parameters',
+        'conservative': 'Conservative: Balanced risk and reward (default)',
+        'aggressive': 'Aggressive: Higher risk, more frequent trades'
+    }
+    
     def __init__(self, parent: tk.Widget, settings: Settings, on_settings_change: Optional[Callable] = None):
         """Initialize ConfigPanel.
         
         Args:
             parent: Parent widget.
             settings: Settings instance.
-            on_settings_change: Callback for settings changes.
+            on_settings_change: Callback for settings changes. Bound methods
+                are held weakly so the panel doesn't keep their owner alive.
         """
         self.parent = parent
         self.settings = settings
         self.on_settings_change = on_settings_change
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.initializing = True
         
         self.is_notebook_parent = isinstance(parent, ttk.Notebook)
@@ -47,7 +350,41 @@ class ConfigPanel:
             self.notebook = ttk.Notebook(self.frame)
             self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
             
-        self.config_vars: Dict[str, tk.Variable] = {}
+        # Status label styles for the fixed amount / portfolio value features;
+        # ttk styles belong to the Tk interpreter, so configure them once per
+        # interpreter
+        style = ttk.Style(self.frame)
+        if not style.lookup('Active.Status.TLabel', 'foreground'):
+            style.configure('Active.Status.TLabel', foreground='green', font=('TkDefaultFont', 9, 'bold'))
+            style.configure('Inactive.Status.TLabel', foreground='gray', font=('TkDefaultFont', 9, 'normal'))
+        
+        # Snapshot returned by _get_current_config(); None when stale
+        self._config_cache: Optional[Dict[str, Any]] = None
+        
+        # Settings change notifications deferred by _batched_updates()
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._notify_pending = False
+        
+        # Background .env saves run one at a time; a save requested while one
+        # is running is queued and only its latest values are written
+        self._persist_running = False
+        self._persist_queued: Optional[Dict[str, str]] = None
+        
+        # .env values last written successfully (or loaded); a save only
+        # rewrites the file when these differ from the settings
+        self._saved_env_values: Dict[str, str] = self.settings.env_file_values()
+        
+        # Strategy tab canvas, whose scroll region is refreshed when idle
+        self._sr_canvas: Optional[tk.Canvas] = None
+        self._sr_pending = False
+        
+        # Risk Management tab widgets, assigned when that tab is built
+        self.fixed_amount_frame: Optional[ttk.LabelFrame] = None
+        self.fixed_amount_entry: Optional[ttk.Entry] = None
+        self.position_method_combo: Optional[ttk.Combobox] = None
+        self.portfolio_value_frame: Optional[ttk.LabelFrame] = None
+        self.portfolio_value_entry: Optional[ttk.Entry] = None
         
         self._create_config_vars()
         self._create_widgets()
@@ -56,77 +393,34 @@ class ConfigPanel:
         self.logger.info("ConfigPanel initialized")
         self.initializing = False
 
+    @property
+    def on_settings_change(self) -> Optional[Callable]:
+        """Callback for settings changes, or None if unset or collected."""
+        return self._on_settings_change_ref()
+    
+    @on_settings_change.setter
+    def on_settings_change(self, callback: Optional[Callable]) -> None:
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            self._on_settings_change_ref = weakref.WeakMethod(callback)
+        else:
+            self._on_settings_change_ref = lambda: callback
+    
     def _create_config_vars(self) -> None:
-        """Create tkinter variables for configuration."""
-        # Strategy parameters
-        self.config_vars.update({
-            # Support/Resistance
-            'support_resistance_lookback': tk.IntVar(value=20),
-            'support_resistance_min_touches': tk.IntVar(value=2),
-            'support_resistance_tolerance': tk.DoubleVar(value=0.01),
-            
-            # RSI parameters
-            'rsi_period': tk.IntVar(value=14),
-            'rsi_oversold': tk.DoubleVar(value=30.0),
-            'rsi_overbought': tk.DoubleVar(value=70.0),
-            
-            # Bollinger Bands
-            'bb_period': tk.IntVar(value=20),
-            'bb_std_dev': tk.DoubleVar(value=2.0),
-            
-            # MACD parameters
-            'macd_fast': tk.IntVar(value=12),
-            'macd_slow': tk.IntVar(value=26),
-            'macd_signal': tk.IntVar(value=9),
-            
-            # Position sizing
-            'position_size_method': tk.StringVar(value='fixed_amount'),
-            'fixed_position_amount': tk.DoubleVar(value=1000.0),
-            'position_size_percent': tk.DoubleVar(value=2.0),
-            'max_position_size': tk.DoubleVar(value=10000.0),
-            
-            # Fixed Trade Amount Feature
-            'fixed_trade_amount_enabled': tk.BooleanVar(value=self.settings.fixed_trade_amount_enabled),
-            'fixed_trade_amount': tk.DoubleVar(value=self.settings.fixed_trade_amount),
-            
-            # Custom Portfolio Value Feature
-            'custom_portfolio_value_enabled': tk.BooleanVar(value=self.settings.custom_portfolio_value_enabled),
-            'custom_portfolio_value': tk.DoubleVar(value=self.settings.custom_portfolio_value),
-            
-            # Risk management
-            'stop_loss_percent': tk.DoubleVar(value=2.0),
-            'take_profit_percent': tk.DoubleVar(value=3.0),
-            'max_daily_loss': tk.DoubleVar(value=500.0),
-            'max_daily_trades': tk.IntVar(value=20),
-            'max_positions': tk.IntVar(value=5),
-            
-            # Trading hours
-            'trading_start_hour': tk.IntVar(value=9),
-            'trading_start_minute': tk.IntVar(value=30),
-            'trading_end_hour': tk.IntVar(value=15),
-            'trading_end_minute': tk.IntVar(value=30),
-            
-            # Data settings
-            'data_update_interval': tk.IntVar(value=5),
-            'chart_timeframe': tk.StringVar(value='1Min'),
-            'max_bars_history': tk.IntVar(value=1000),
-            
-            # Auto-selection criteria
-            'auto_select_enabled': tk.BooleanVar(value=False),
-            'auto_select_max_symbols': tk.IntVar(value=10),
-            'auto_select_min_volume': tk.IntVar(value=1000000),
-            'auto_select_min_price': tk.DoubleVar(value=10.0),
-            'auto_select_max_price': tk.DoubleVar(value=500.0),
-            'auto_select_min_volatility': tk.DoubleVar(value=0.02),
-            
-            # Logging
-            'log_level': tk.StringVar(value='INFO'),
-            'log_to_file': tk.BooleanVar(value=True),
-            'max_log_files': tk.IntVar(value=10),
-            
-            # Trading mode
-            'trading_mode': tk.StringVar(value='conservative'),
-        })
+        """Create tkinter variables for configuration.
+        
+        Variables are created on first access; features backed by the
+        settings instance start from the current settings values.
+        """
+        self.config_vars = _LazyVarDict(self.frame, _VAR_SPEC, {
+            'fixed_trade_amount_enabled': self.settings.fixed_trade_amount_enabled,
+            'fixed_trade_amount': self.settings.fixed_trade_amount,
+            'custom_portfolio_value_enabled': self.settings.custom_portfolio_value_enabled,
+            'custom_portfolio_value': self.settings.custom_portfolio_value,
+        }, on_write=self._on_var_write)
+        
+        # One trace keeps every tab's trading mode description current
+        self._mode_desc_labels: List[ttk.Label] = []
+        self.config_vars['trading_mode'].trace_add('write', self._broadcast_mode_desc)
     
     def _create_widgets(self) -> None:
         """Create the configuration widgets."""
@@ -135,42 +429,63 @@ class ConfigPanel:
             self.notebook = ttk.Notebook(self.frame)
             self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Strategy tab
-        self._create_strategy_tab()
-        
-        # Risk Management tab
-        self._create_risk_tab()
-        
-        # Trading Hours tab
-        self._create_trading_hours_tab()
-        
-        # Auto-Selection tab
-        self._create_auto_selection_tab()
-        
-        # Data & Display tab
-        self._create_data_tab()
-        
-        # Logging tab
-        self._create_logging_tab()
+        # Add empty tabs; each is filled in the first time it is selected
+        self._tab_builders: Dict[str, Callable[[ttk.Frame], None]] = {}
+        for text, builder in (
+            ("Strategy", self._create_strategy_tab),
+            ("Risk Management", self._create_risk_tab),
+            ("Trading Hours", self._create_trading_hours_tab),
+            ("Auto-Selection", self._create_auto_selection_tab),
+            ("Data & Display", self._create_data_tab),
+            ("Logging", self._create_logging_tab),
+        ):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=text)
+            self._tab_builders[str(tab_frame)] = builder
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+        self._on_tab_changed()  # Build the initially selected tab, if ours
         
         # Control buttons (only for standalone mode)
         if not self.is_notebook_parent:
             self._create_control_buttons()
     
-    def _create_strategy_tab(self) -> None:
-        """Create strategy parameters tab."""
-        strategy_frame = ttk.Frame(self.notebook)
-        self.notebook.add(strategy_frame, text="Strategy")
+    def _on_tab_changed(self, event: Optional[tk.Event] = None) -> None:
+        """Build the selected configuration tab the first time it is shown.
+        
+        Args:
+            event: Notebook tab change event (unused).
+        """
+        if not self._tab_builders:
+            return
+        
+        tab_id = self.notebook.select()
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder is None:
+            return
+        
+        # Status updates run while building must not report a settings change
+        initializing = self.initializing
+        self.initializing = True
+        try:
+            builder(self.notebook.nametowidget(tab_id))
+        finally:
+            self.initializing = initializing
+    
+    def _create_strategy_tab(self, strategy_frame: ttk.Frame) -> None:
+        """Create strategy parameters tab.
+        
+        Args:
+            strategy_frame: Notebook tab frame to fill.
+        """
         
         # Create scrollable frame
         canvas = tk.Canvas(strategy_frame)
         scrollbar = ttk.Scrollbar(strategy_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._sr_canvas = canvas
+        scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -179,32 +494,40 @@ class ConfigPanel:
         sr_frame = ttk.LabelFrame(scrollable_frame, text="Support/Resistance Detection", padding=10)
         sr_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(sr_frame, "Lookback Period:", 'support_resistance_lookback', 5, 100, row=0)
-        self._create_labeled_spinbox(sr_frame, "Min Touches:", 'support_resistance_min_touches', 1, 10, row=1)
-        self._create_labeled_entry(sr_frame, "Tolerance (%):", 'support_resistance_tolerance', row=2)
+        self._build_form(sr_frame, (
+            ("Lookback Period:", 'support_resistance_lookback', 5, 100),
+            ("Min Touches:", 'support_resistance_min_touches', 1, 10),
+            ("Tolerance (%):", 'support_resistance_tolerance'),
+        ))
         
         # RSI section
         rsi_frame = ttk.LabelFrame(scrollable_frame, text="RSI Parameters", padding=10)
         rsi_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(rsi_frame, "RSI Period:", 'rsi_period', 5, 50, row=0)
-        self._create_labeled_entry(rsi_frame, "Oversold Level:", 'rsi_oversold', row=1)
-        self._create_labeled_entry(rsi_frame, "Overbought Level:", 'rsi_overbought', row=2)
+        self._build_form(rsi_frame, (
+            ("RSI Period:", 'rsi_period', 5, 50),
+            ("Oversold Level:", 'rsi_oversold'),
+            ("Overbought Level:", 'rsi_overbought'),
+        ))
         
         # Bollinger Bands section
         bb_frame = ttk.LabelFrame(scrollable_frame, text="Bollinger Bands", padding=10)
         bb_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(bb_frame, "Period:", 'bb_period', 5, 50, row=0)
-        self._create_labeled_entry(bb_frame, "Standard Deviations:", 'bb_std_dev', row=1)
+        self._build_form(bb_frame, (
+            ("Period:", 'bb_period', 5, 50),
+            ("Standard Deviations:", 'bb_std_dev'),
+        ))
         
         # MACD section
         macd_frame = ttk.LabelFrame(scrollable_frame, text="MACD Parameters", padding=10)
         macd_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(macd_frame, "Fast Period:", 'macd_fast', 5, 50, row=0)
-        self._create_labeled_spinbox(macd_frame, "Slow Period:", 'macd_slow', 10, 100, row=1)
-        self._create_labeled_spinbox(macd_frame, "Signal Period:", 'macd_signal', 5, 20, row=2)
+        self._build_form(macd_frame, (
+            ("Fast Period:", 'macd_fast', 5, 50),
+            ("Slow Period:", 'macd_slow', 10, 100),
+            ("Signal Period:", 'macd_signal', 5, 20),
+        ))
         
         # Trading mode section
         mode_frame = ttk.LabelFrame(scrollable_frame, text="Trading Mode", padding=10)
@@ -214,36 +537,43 @@ class ConfigPanel:
         mode_combo = ttk.Combobox(
             mode_frame,
             textvariable=self.config_vars['trading_mode'],
-            values=['ultra_safe', 'conservative', 'aggressive'],
+            values=_MODE_VALUES,
             state='readonly',
             width=20
         )
         mode_combo.pack(anchor=tk.W, pady=2)
         
-        # Mode descriptions
-        descriptions = {
-            'ultra_safe': 'Ultra-Safe: Minimal risk, very conservative parameters',
-            'conservative': 'Conservative: Balanced risk and reward (default)',
-            'aggressive': 'Aggressive: Higher risk, more frequent trades'
-        }
-        
-        desc_label = ttk.Label(mode_frame, text=descriptions['conservative'], foreground='gray')
+        # Mode description
+        desc_label = ttk.Label(mode_frame, text=self._current_mode_desc(), foreground='gray')
         desc_label.pack(anchor=tk.W, pady=2)
         
-        def update_description(event=None):
-            selected = self.config_vars['trading_mode'].get()
-            desc_label.config(text=descriptions.get(selected, ''))
-        
-        mode_combo.bind('<<ComboboxSelected>>', update_description)
-        self.config_vars['trading_mode'].trace('w', lambda *args: update_description())
+        self._mode_desc_labels.append(desc_label)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def _create_risk_tab(self) -> None:
-        """Create risk management tab."""
-        risk_frame = ttk.Frame(self.notebook)
-        self.notebook.add(risk_frame, text="Risk Management")
+    def _schedule_scrollregion(self, event: Optional[tk.Event] = None) -> None:
+        """Refresh the Strategy tab scroll region once Tk is idle.
+        
+        Args:
+            event: Configure event (unused).
+        """
+        if self._sr_pending:
+            return
+        self._sr_pending = True
+        self.frame.after_idle(self._apply_scrollregion)
+    
+    def _apply_scrollregion(self) -> None:
+        """Fit the Strategy tab scroll region to its contents."""
+        self._sr_pending = False
+        self._sr_canvas.configure(scrollregion=self._sr_canvas.bbox("all"))
+    
+    def _create_risk_tab(self, risk_frame: ttk.Frame) -> None:
+        """Create risk management tab.
+        
+        Args:
+            risk_frame: Notebook tab frame to fill.
+        """
         
         # Position sizing section
         position_frame = ttk.LabelFrame(risk_frame, text="Position Sizing", padding=10)
@@ -270,14 +600,11 @@ class ConfigPanel:
         )
         self.fixed_amount_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
         
-        # Add validation to the fixed amount entry
-        self.config_vars['fixed_trade_amount'].trace('w', self._validate_fixed_trade_amount)
-        
         # Status indicator
         self.fixed_amount_status = ttk.Label(
             self.fixed_amount_frame,
             text="Inactive",
-            foreground="gray"
+            style='Inactive.Status.TLabel'
         )
         self.fixed_amount_status.grid(row=1, column=2, sticky=tk.W, padx=10, pady=2)
         
@@ -289,18 +616,20 @@ class ConfigPanel:
         self.position_method_combo = ttk.Combobox(
             position_frame,
             textvariable=self.config_vars['position_size_method'],
-            values=['fixed_amount', 'percent_of_portfolio', 'volatility_based'],
+            values=_POSITION_SIZE_METHODS,
             state="readonly",
             width=20
         )
         self.position_method_combo.grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
         
-        self._create_labeled_entry(position_frame, "Fixed Amount ($):", 'fixed_position_amount', row=3)
-        self._create_labeled_entry(position_frame, "Portfolio Percent (%):", 'position_size_percent', row=4)
-        self._create_labeled_entry(position_frame, "Max Position Size ($):", 'max_position_size', row=5)
+        self._build_form(position_frame, (
+            ("Fixed Amount ($):", 'fixed_position_amount'),
+            ("Portfolio Percent (%):", 'position_size_percent'),
+            ("Max Position Size ($):", 'max_position_size'),
+        ), start_row=3)
         
         # Update status indicator when checkbox changes
-        self.config_vars['fixed_trade_amount_enabled'].trace('w', lambda *args: self._update_fixed_amount_status())
+        self.config_vars['fixed_trade_amount_enabled'].trace('w', self._update_fixed_amount_status)
         self._update_fixed_amount_status()  # Initial update
         
         # Custom Portfolio Value Feature
@@ -324,66 +653,70 @@ class ConfigPanel:
         )
         self.portfolio_value_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
         
-        # Add validation to the portfolio value entry
-        self.config_vars['custom_portfolio_value'].trace('w', self._validate_custom_portfolio_value)
-        
         # Status indicator
         self.portfolio_value_status = ttk.Label(
             self.portfolio_value_frame,
             text="Using Real Portfolio Value",
-            foreground="gray"
+            style='Inactive.Status.TLabel'
         )
         self.portfolio_value_status.grid(row=1, column=2, sticky=tk.W, padx=10, pady=2)
         
         # Update status indicator when checkbox changes
-        self.config_vars['custom_portfolio_value_enabled'].trace('w', lambda *args: self._update_portfolio_value_status())
+        self.config_vars['custom_portfolio_value_enabled'].trace('w', self._update_portfolio_value_status)
         self._update_portfolio_value_status()  # Initial update
         
         # Risk limits section
         limits_frame = ttk.LabelFrame(risk_frame, text="Risk Limits", padding=10)
         limits_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_entry(limits_frame, "Stop Loss (%):", 'stop_loss_percent', row=0)
-        self._create_labeled_entry(limits_frame, "Take Profit (%):", 'take_profit_percent', row=1)
-        self._create_labeled_entry(limits_frame, "Max Daily Loss ($):", 'max_daily_loss', row=2)
-        self._create_labeled_spinbox(limits_frame, "Max Daily Trades:", 'max_daily_trades', 1, 100, row=3)
-        self._create_labeled_spinbox(limits_frame, "Max Positions:", 'max_positions', 1, 20, row=4)
+        self._build_form(limits_frame, (
+            ("Stop Loss (%):", 'stop_loss_percent'),
+            ("Take Profit (%):", 'take_profit_percent'),
+            ("Max Daily Loss ($):", 'max_daily_loss'),
+            ("Max Daily Trades:", 'max_daily_trades', 1, 100),
+            ("Max Positions:", 'max_positions', 1, 20),
+        ))
         
         # Trading mode section
         mode_frame = ttk.LabelFrame(risk_frame, text="Trading Mode", padding=10)
         mode_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        ttk.Label(mode_frame, text="Trading Mode:").pack(anchor=tk.W, pady=2)
-        mode_combo_risk = ttk.Combobox(
-            mode_frame,
-            textvariable=self.config_vars['trading_mode'],
-            values=['ultra_safe', 'conservative', 'aggressive'],
-            state='readonly',
-            width=20
-        )
-        mode_combo_risk.pack(anchor=tk.W, pady=2)
-        
-        # Mode descriptions for risk tab
-        risk_descriptions = {
-            'ultra_safe': 'Ultra-Safe: Minimal risk, very conservative parameters',
-            'conservative': 'Conservative: Balanced risk and reward (default)',
-            'aggressive': 'Aggressive: Higher risk, more frequent trades'
-        }
+        # Read-only mirror; the mode is chosen on the Strategy tab
+        mode_row = ttk.Frame(mode_frame)
+        mode_row.pack(anchor=tk.W, pady=2)
+        ttk.Label(mode_row, text="Trading Mode:").pack(side=tk.LEFT)
+        ttk.Label(mode_row, textvariable=self.config_vars['trading_mode']).pack(side=tk.LEFT, padx=(5, 0))
         
-        risk_desc_label = ttk.Label(mode_frame, text=risk_descriptions['conservative'], foreground='gray')
+        # Mode description for risk tab
+        risk_desc_label = ttk.Label(mode_frame, text=self._current_mode_desc(), foreground='gray')
         risk_desc_label.pack(anchor=tk.W, pady=2)
         
-        def update_risk_description(event=None):
-            selected = self.config_vars['trading_mode'].get()
-            risk_desc_label.config(text=risk_descriptions.get(selected, ''))
+        self._mode_desc_labels.append(risk_desc_label)
+    
+    def _broadcast_mode_desc(self, *args) -> None:
+        """Show the description of the selected trading mode in every tab.
         
-        mode_combo_risk.bind('<<ComboboxSelected>>', update_risk_description)
-        self.config_vars['trading_mode'].trace('w', lambda *args: update_risk_description())
+        Args:
+            *args: Variable trace arguments (unused).
+        """
+        description = self._current_mode_desc()
+        for label in self._mode_desc_labels:
+            label.config(text=description)
     
-    def _create_trading_hours_tab(self) -> None:
-        """Create trading hours tab."""
-        hours_frame = ttk.Frame(self.notebook)
-        self.notebook.add(hours_frame, text="Trading Hours")
+    def _current_mode_desc(self) -> str:
+        """Get the description of the selected trading mode.
+        
+        Returns:
+            Description text, or an empty string for an unknown mode.
+        """
+        return self._MODE_DESCRIPTIONS.get(self.config_vars['trading_mode'].get(), '')
+    
+    def _create_trading_hours_tab(self, hours_frame: ttk.Frame) -> None:
+        """Create trading hours tab.
+        
+        Args:
+            hours_frame: Notebook tab frame to fill.
+        """
         
         # Trading hours section
         time_frame = ttk.LabelFrame(hours_frame, text="Active Trading Hours (EST)", padding=10)
@@ -444,25 +777,27 @@ class ConfigPanel:
         ttk.Button(
             preset_frame,
             text="Market Hours (9:30-16:00)",
-            command=lambda: self._set_trading_hours(9, 30, 16, 0)
+            command=functools.partial(self._set_trading_hours, 9, 30, 16, 0)
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             preset_frame,
             text="Extended Hours (4:00-20:00)",
-            command=lambda: self._set_trading_hours(4, 0, 20, 0)
+            command=functools.partial(self._set_trading_hours, 4, 0, 20, 0)
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             preset_frame,
             text="Opening Hour (9:30-10:30)",
-            command=lambda: self._set_trading_hours(9, 30, 10, 30)
+            command=functools.partial(self._set_trading_hours, 9, 30, 10, 30)
         ).pack(side=tk.LEFT, padx=5)
     
-    def _create_auto_selection_tab(self) -> None:
-        """Create auto-selection tab."""
-        auto_frame = ttk.Frame(self.notebook)
-        self.notebook.add(auto_frame, text="Auto-Selection")
+    def _create_auto_selection_tab(self, auto_frame: ttk.Frame) -> None:
+        """Create auto-selection tab.
+        
+        Args:
+            auto_frame: Notebook tab frame to fill.
+        """
         
         # Enable auto-selection
         ttk.Checkbutton(
@@ -475,40 +810,50 @@ class ConfigPanel:
         criteria_frame = ttk.LabelFrame(auto_frame, text="Selection Criteria", padding=10)
         criteria_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(criteria_frame, "Max Symbols:", 'auto_select_max_symbols', 1, 50, row=0)
-        self._create_labeled_entry(criteria_frame, "Min Volume:", 'auto_select_min_volume', row=1)
-        self._create_labeled_entry(criteria_frame, "Min Price ($):", 'auto_select_min_price', row=2)
-        self._create_labeled_entry(criteria_frame, "Max Price ($):", 'auto_select_max_price', row=3)
-        self._create_labeled_entry(criteria_frame, "Min Volatility:", 'auto_select_min_volatility', row=4)
+        self._build_form(criteria_frame, (
+            ("Max Symbols:", 'auto_select_max_symbols', 1, 50),
+            ("Min Volume:", 'auto_select_min_volume'),
+            ("Min Price ($):", 'auto_select_min_price'),
+            ("Max Price ($):", 'auto_select_max_price'),
+            ("Min Volatility:", 'auto_select_min_volatility'),
+        ))
     
-    def _create_data_tab(self) -> None:
-        """Create data and display tab."""
-        data_frame = ttk.Frame(self.notebook)
-        self.notebook.add(data_frame, text="Data & Display")
+    def _create_data_tab(self, data_frame: ttk.Frame) -> None:
+        """Create data and display tab.
+        
+        Args:
+            data_frame: Notebook tab frame to fill.
+        """
         
         # Data settings
         data_settings_frame = ttk.LabelFrame(data_frame, text="Data Settings", padding=10)
         data_settings_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self._create_labeled_spinbox(data_settings_frame, "Update Interval (sec):", 'data_update_interval', 1, 60, row=0)
+        self._build_form(data_settings_frame, (
+            ("Update Interval (sec):", 'data_update_interval', 1, 60),
+        ))
         
         # Chart timeframe
         ttk.Label(data_settings_frame, text="Chart Timeframe:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         timeframe_combo = ttk.Combobox(
             data_settings_frame,
             textvariable=self.config_vars['chart_timeframe'],
-            values=['1Min', '5Min', '15Min', '1Hour', '1Day'],
+            values=_CHART_TIMEFRAMES,
             state="readonly",
             width=20
         )
         timeframe_combo.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
         
-        self._create_labeled_spinbox(data_settings_frame, "Max Bars History:", 'max_bars_history', 100, 10000, row=2)
+        self._build_form(data_settings_frame, (
+            ("Max Bars History:", 'max_bars_history', 100, 10000),
+        ), start_row=2)
     
-    def _create_logging_tab(self) -> None:
-        """Create logging configuration tab."""
-        log_frame = ttk.Frame(self.notebook)
-        self.notebook.add(log_frame, text="Logging")
+    def _create_logging_tab(self, log_frame: ttk.Frame) -> None:
+        """Create logging configuration tab.
+        
+        Args:
+            log_frame: Notebook tab frame to fill.
+        """
         
         # Logging settings
         log_settings_frame = ttk.LabelFrame(log_frame, text="Logging Settings", padding=10)
@@ -519,7 +864,7 @@ class ConfigPanel:
         level_combo = ttk.Combobox(
             log_settings_frame,
             textvariable=self.config_vars['log_level'],
-            values=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+            values=_LOG_LEVELS,
             state="readonly",
             width=20
         )
@@ -532,7 +877,9 @@ class ConfigPanel:
             variable=self.config_vars['log_to_file']
         ).grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
         
-        self._create_labeled_spinbox(log_settings_frame, "Max Log Files:", 'max_log_files', 1, 50, row=2)
+        self._build_form(log_settings_frame, (
+            ("Max Log Files:", 'max_log_files', 1, 50),
+        ), start_row=2)
     
     def _create_control_buttons(self) -> None:
         """Create control buttons."""
@@ -574,45 +921,28 @@ class ConfigPanel:
             command=self._import_config
         ).pack(side=tk.LEFT, padx=5)
     
-    def _create_labeled_entry(self, parent: tk.Widget, label: str, var_name: str, row: int) -> None:
-        """Create a labeled entry widget.
-        
-        Args:
-            parent: Parent widget.
-            label: Label text.
-            var_name: Variable name.
-            row: Grid row.
-        """
-        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
-        
-        entry = ttk.Entry(
-            parent,
-            textvariable=self.config_vars[var_name],
-            width=20
-        )
-        entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-    
-    def _create_labeled_spinbox(self, parent: tk.Widget, label: str, var_name: str, 
-                               from_: int, to: int, row: int) -> None:
-        """Create a labeled spinbox widget.
+    def _build_form(self, parent: tk.Widget, rows: Tuple[Tuple[Any, ...], ...],
+                    start_row: int = 0) -> None:
+        """Create a grid of labeled entry and spinbox widgets.
         
         Args:
             parent: Parent widget.
-            label: Label text.
-            var_name: Variable name.
-            from_: Minimum value.
-            to: Maximum value.
-            row: Grid row.
+            rows: ``(label, var_name)`` for an entry, or
+                ``(label, var_name, from_, to)`` for a spinbox.
+            start_row: Grid row of the first form row.
         """
-        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        config_vars = self.config_vars
+        label_cls, entry_cls, spinbox_cls = ttk.Label, ttk.Entry, ttk.Spinbox
         
-        spinbox = ttk.Spinbox(
-            parent,
-            from_=from_, to=to,
-            textvariable=self.config_vars[var_name],
-            width=20
-        )
-        spinbox.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        for row, (label, var_name, *limits) in enumerate(rows, start_row):
+            label_cls(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+            
+            if limits:
+                from_, to = limits
+                widget = spinbox_cls(parent, from_=from_, to=to, textvariable=config_vars[var_name], width=20)
+            else:
+                widget = entry_cls(parent, textvariable=config_vars[var_name], width=20)
+            widget.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
     
     def _set_trading_hours(self, start_hour: int, start_min: int, end_hour: int, end_min: int) -> None:
         """Set trading hours preset.
@@ -628,361 +958,342 @@ class ConfigPanel:
         self.config_vars['trading_end_hour'].set(end_hour)
         self.config_vars['trading_end_minute'].set(end_min)
     
-    def _validate_fixed_trade_amount(self, *args) -> bool:
-        """Validate the fixed trade amount.
+    def _get_float(self, var_name: str) -> Optional[float]:
+        """Read a numeric config variable without raising on partial input.
         
+        Args:
+            var_name: Variable name.
+            
         Returns:
-            True if valid, False otherwise.
+            The value as a float, or None if the entry isn't a valid number.
         """
-        try:
-            amount = self.config_vars['fixed_trade_amount'].get()
-            min_amount = getattr(self.settings, 'min_trade_amount', 1.0)
-            max_amount = getattr(self.settings, 'max_trade_amount', 10000.0)
-            
-            # Only validate on save, not during typing
-            # Allow any value >= $1.0 without showing error alerts
-            if amount >= min_amount and amount <= max_amount:
-                return True
-            
-            return True  # Allow typing without interruption
-            
-        except (ValueError, tk.TclError):
-            # Don't show error during typing, only return False
-            return False
+        raw = str(self.frame.getvar(str(self.config_vars[var_name]))).strip()
+        if not _NUMBER_RE.fullmatch(raw):
+            return None
+        return float(raw)
     
-    def _validate_custom_portfolio_value(self, *args) -> bool:
-        """Validate the custom portfolio value.
+    def _update_fixed_amount_status(self, *args) -> None:
+        """Update visual indicators when fixed amount feature is toggled.
         
-        Returns:
-            True if valid, False otherwise.
+        Args:
+            *args: Variable trace arguments (unused).
         """
-        try:
-            value = self.config_vars['custom_portfolio_value'].get()
-            min_value = getattr(self.settings, 'min_portfolio_value', 1.0)
-            max_value = getattr(self.settings, 'max_portfolio_value', 1000000.0)
-            
-            # Only validate on save, not during typing
-            # Allow any value >= $1.0 without showing error alerts
-            if value >= min_value and value <= max_value:
-                return True
-            
-            return True  # Allow typing without interruption
-            
-        except (ValueError, tk.TclError):
-            # Don't show error during typing, only return False
-            return False
-    
-    def _update_fixed_amount_status(self) -> None:
-        """Update visual indicators when fixed amount feature is toggled."""
         is_enabled = self.config_vars['fixed_trade_amount_enabled'].get()
         
         if is_enabled:
             # Update frame title to show active state
-            if hasattr(self, 'fixed_amount_frame'):
+            if self.fixed_amount_frame is not None:
                 self.fixed_amount_frame.config(text="Fixed Trade Amount - ACTIVE")
             
-            # Update status indicator to show active state
+            # Update status indicator to show active state and current amount
+            amount = self._get_float('fixed_trade_amount')
             self.fixed_amount_status.config(
-                text="ACTIVE",
-                foreground="green",
-                font=('TkDefaultFont', 9, 'bold')
+                text=f"ACTIVE (${amount:.2f})" if amount is not None and amount > 0 else "ACTIVE",
+                style='Active.Status.TLabel'
             )
             
             # Highlight the entry field
-            if hasattr(self, 'fixed_amount_entry'):
+            if self.fixed_amount_entry is not None:
                 self.fixed_amount_entry.config(style='Active.TEntry')
             
             # Disable position sizing method combobox when fixed amount is active
-            if hasattr(self, 'position_method_combo'):
+            if self.position_method_combo is not None:
                 self.position_method_combo.config(state='disabled')
             
-            # Show current fixed amount in status
-            try:
-                amount = self.config_vars['fixed_trade_amount'].get()
-                if amount > 0:
-                    self.fixed_amount_status.config(text=f"ACTIVE (${amount:.2f})")
-            except (ValueError, tk.TclError):
-                pass
-                
             self.logger.info("Fixed trade amount feature activated")
         else:
             # Update frame title to show inactive state
-            if hasattr(self, 'fixed_amount_frame'):
+            if self.fixed_amount_frame is not None:
                 self.fixed_amount_frame.config(text="Fixed Trade Amount")
             
             # Update status indicator to show inactive state
-            self.fixed_amount_status.config(
-                text="Inactive",
-                foreground="gray",
-                font=('TkDefaultFont', 9, 'normal')
-            )
+            self.fixed_amount_status.config(text="Inactive", style='Inactive.Status.TLabel')
             
             # Reset entry field styling
-            if hasattr(self, 'fixed_amount_entry'):
+            if self.fixed_amount_entry is not None:
                 self.fixed_amount_entry.config(style='TEntry')
             
             # Re-enable position sizing method combobox
-            if hasattr(self, 'position_method_combo'):
+            if self.position_method_combo is not None:
                 self.position_method_combo.config(state='readonly')
                 
             self.logger.info("Fixed trade amount feature deactivated")
         
         # Notify of settings change without saving
-        if not self.initializing and self.on_settings_change:
-            config_dict = self._get_current_config()
-            self.on_settings_change(config_dict)
+        self._notify_settings_change()
     
-    def _update_portfolio_value_status(self) -> None:
-        """Update visual indicators when custom portfolio value feature is toggled."""
+    def _update_portfolio_value_status(self, *args) -> None:
+        """Update visual indicators when custom portfolio value feature is toggled.
+        
+        Args:
+            *args: Variable trace arguments (unused).
+        """
         is_enabled = self.config_vars['custom_portfolio_value_enabled'].get()
         
         if is_enabled:
             # Update frame title to show active state
-            if hasattr(self, 'portfolio_value_frame'):
+            if self.portfolio_value_frame is not None:
                 self.portfolio_value_frame.config(text="Custom Portfolio Value - ACTIVE")
             
-            # Update status indicator to show active state
+            # Update status indicator to show active state and current value
+            value = self._get_float('custom_portfolio_value')
             self.portfolio_value_status.config(
-                text="ACTIVE",
-                foreground="green",
-                font=('TkDefaultFont', 9, 'bold')
+                text=f"ACTIVE (${value:,.2f})" if value is not None and value > 0 else "ACTIVE",
+                style='Active.Status.TLabel'
             )
             
             # Highlight the entry field
-            if hasattr(self, 'portfolio_value_entry'):
+            if self.portfolio_value_entry is not None:
                 self.portfolio_value_entry.config(style='Active.TEntry')
             
-            # Show current portfolio value in status
-            try:
-                value = self.config_vars['custom_portfolio_value'].get()
-                if value > 0:
-                    self.portfolio_value_status.config(text=f"ACTIVE (${value:,.2f})")
-            except (ValueError, tk.TclError):
-                pass
-                
             self.logger.info("Custom portfolio value feature activated")
         else:
             # Update frame title to show inactive state
-            if hasattr(self, 'portfolio_value_frame'):
+            if self.portfolio_value_frame is not None:
                 self.portfolio_value_frame.config(text="Custom Portfolio Value")
             
             # Update status indicator to show inactive state
             self.portfolio_value_status.config(
                 text="Using Real Portfolio Value",
-                foreground="gray",
-                font=('TkDefaultFont', 9, 'normal')
+                style='Inactive.Status.TLabel'
             )
             
             # Reset entry field styling
-            if hasattr(self, 'portfolio_value_entry'):
+            if self.portfolio_value_entry is not None:
                 self.portfolio_value_entry.config(style='TEntry')
                 
             self.logger.info("Custom portfolio value feature deactivated")
         
         # Notify of settings change without saving
-        if not self.initializing and self.on_settings_change:
-            config_dict = self._get_current_config()
-            self.on_settings_change(config_dict)
+        self._notify_settings_change()
      
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        """Coalesce settings change notifications made inside the block.
+        
+        Notifications requested while the block runs are deferred and sent
+        once when the outermost block exits, followed by a single redraw of
+        the panel. Blocks may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_dirty:
+                    self._batch_dirty = False
+                    self._notify_settings_change()
+                if not self.initializing:
+                    self.frame.update_idletasks()
+    
+    def _notify_settings_change(self) -> None:
+        """Report the current configuration to the settings change callback.
+        
+        The callback runs once Tk is idle, so several changes made in the
+        same event loop turn are reported together.
+        """
+        if self.initializing or not self.on_settings_change:
+            return
+        
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        
+        if not self._notify_pending:
+            self._notify_pending = True
+            self.frame.after_idle(self._flush_notify)
+    
+    def _flush_notify(self) -> None:
+        """Send a notification scheduled by _notify_settings_change."""
+        self._notify_pending = False
+        if not self.on_settings_change:
+            return
+        
+        try:
+            config = self._get_current_config()
+        except (ValueError, tk.TclError) as e:
+            # An entry holds partial input; report once it is valid again
+            self.logger.debug("Skipping settings change notification: %s", e)
+            return
+        self.on_settings_change(config)
+    
     def _load_settings(self) -> None:
         """Load settings from the settings instance."""
         try:
-            # Map settings to config variables
-            settings_mapping = {
-                # Strategy parameters
-                'support_resistance_lookback': 'SUPPORT_RESISTANCE_LOOKBACK',
-                'support_resistance_min_touches': 'SUPPORT_RESISTANCE_MIN_TOUCHES',
-                'support_resistance_tolerance': 'SUPPORT_RESISTANCE_TOLERANCE',
-                'rsi_period': 'RSI_PERIOD',
-                'rsi_oversold': 'RSI_OVERSOLD',
-                'rsi_overbought': 'RSI_OVERBOUGHT',
-                'bb_period': 'BB_PERIOD',
-                'bb_std_dev': 'BB_STD_DEV',
-                'macd_fast': 'MACD_FAST',
-                'macd_slow': 'MACD_SLOW',
-                'macd_signal': 'MACD_SIGNAL',
-                
-                # Position sizing
-                'position_size_method': 'POSITION_SIZE_METHOD',
-                'fixed_position_amount': 'FIXED_POSITION_AMOUNT',
-                'position_size_percent': 'POSITION_SIZE_PERCENT',
-                'max_position_size': 'MAX_POSITION_SIZE',
-                
-                # Fixed Trade Amount Feature
-                'fixed_trade_amount_enabled': 'fixed_trade_amount_enabled',
-                'fixed_trade_amount': 'fixed_trade_amount',
-                
-                # Custom Portfolio Value Feature
-                'custom_portfolio_value_enabled': 'custom_portfolio_value_enabled',
-                'custom_portfolio_value': 'custom_portfolio_value',
-                
-                # Risk management
-                'stop_loss_percent': 'STOP_LOSS_PERCENT',
-                'take_profit_percent': 'TAKE_PROFIT_PERCENT',
-                'max_daily_loss': 'MAX_DAILY_LOSS',
-                'max_daily_trades': 'MAX_DAILY_TRADES',
-                'max_positions': 'MAX_POSITIONS',
-                
-                # Trading hours
-                'trading_start_hour': 'TRADING_START_HOUR',
-                'trading_start_minute': 'TRADING_START_MINUTE',
-                'trading_end_hour': 'TRADING_END_HOUR',
-                'trading_end_minute': 'TRADING_END_MINUTE',
-                
-                # Data settings
-                'data_update_interval': 'DATA_UPDATE_INTERVAL',
-                'chart_timeframe': 'CHART_TIMEFRAME',
-                'max_bars_history': 'MAX_BARS_HISTORY',
-                
-                # Auto-selection
-                'auto_select_enabled': 'AUTO_SELECT_ENABLED',
-                'auto_select_max_symbols': 'AUTO_SELECT_MAX_SYMBOLS',
-                'auto_select_min_volume': 'AUTO_SELECT_MIN_VOLUME',
-                'auto_select_min_price': 'AUTO_SELECT_MIN_PRICE',
-                'auto_select_max_price': 'AUTO_SELECT_MAX_PRICE',
-                'auto_select_min_volatility': 'AUTO_SELECT_MIN_VOLATILITY',
-                
-                # Logging
-                'log_level': 'LOG_LEVEL',
-                'log_to_file': 'LOG_TO_FILE',
-                'max_log_files': 'MAX_LOG_FILES',
-                
-                # Trading mode
-                'trading_mode': 'trading_mode',
-            }
+            # Attributes the settings object has, including ones added by saves
+            settings_attrs = frozenset(dir(self.settings))
             
-            # Load values from settings
-            for var_name, setting_name in settings_mapping.items():
-                if hasattr(self.settings, setting_name):
-                    value = getattr(self.settings, setting_name)
-                    if var_name in self.config_vars:
-                        self.config_vars[var_name].set(value)
+            # Load values from settings, skipping variables that already match
+            current = self._config_snapshot()
+            with self._batched_updates():
+                for var_name, setting_name in _LOAD_MAPPING.items():
+                    if setting_name in settings_attrs and var_name in self.config_vars:
+                        value = getattr(self.settings, setting_name)
+                        if current.get(var_name, _MISSING) != value:
+                            self.config_vars[var_name].set(value)
             
             self.logger.info("Settings loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading settings: {e}")
+            from tkinter import messagebox
+            
+            self.logger.error("Error loading settings: %s", e)
             messagebox.showerror("Error", f"Failed to load settings: {e}")
     
+    def _config_snapshot(self) -> Mapping[str, Any]:
+        """Get the cached current configuration without raising.
+        
+        Returns:
+            The result of _get_current_config(), or an empty mapping when an
+            entry holds invalid input.
+        """
+        try:
+            return self._get_current_config()
+        except (ValueError, tk.TclError):
+            return {}
+    
     def _save_settings(self) -> None:
         """Save current configuration to settings."""
+        from tkinter import messagebox
+        
         try:
-            # Update settings from config variables
-            settings_mapping = {
-                # Strategy parameters
-                'SUPPORT_RESISTANCE_LOOKBACK': 'support_resistance_lookback',
-                'SUPPORT_RESISTANCE_MIN_TOUCHES': 'support_resistance_min_touches',
-                'SUPPORT_RESISTANCE_TOLERANCE': 'support_resistance_tolerance',
-                'RSI_PERIOD': 'rsi_period',
-                'RSI_OVERSOLD': 'rsi_oversold',
-                'RSI_OVERBOUGHT': 'rsi_overbought',
-                'BB_PERIOD': 'bb_period',
-                'BB_STD_DEV': 'bb_std_dev',
-                'MACD_FAST': 'macd_fast',
-                'MACD_SLOW': 'macd_slow',
-                'MACD_SIGNAL': 'macd_signal',
-                
-                # Position sizing
-                'POSITION_SIZE_METHOD': 'position_size_method',
-                'FIXED_POSITION_AMOUNT': 'fixed_position_amount',
-                'POSITION_SIZE_PERCENT': 'position_size_percent',
-                'MAX_POSITION_SIZE': 'max_position_size',
-                
-                # Fixed Trade Amount Feature
-                'fixed_trade_amount_enabled': 'fixed_trade_amount_enabled',
-                'fixed_trade_amount': 'fixed_trade_amount',
-                
-                # Risk management
-                'STOP_LOSS_PERCENT': 'stop_loss_percent',
-                'TAKE_PROFIT_PERCENT': 'take_profit_percent',
-                'MAX_DAILY_LOSS': 'max_daily_loss',
-                'MAX_DAILY_TRADES': 'max_daily_trades',
-                'MAX_POSITIONS': 'max_positions',
-                
-                # Trading hours
-                'TRADING_START_HOUR': 'trading_start_hour',
-                'TRADING_START_MINUTE': 'trading_start_minute',
-                'TRADING_END_HOUR': 'trading_end_hour',
-                'TRADING_END_MINUTE': 'trading_end_minute',
-                
-                # Data settings
-                'DATA_UPDATE_INTERVAL': 'data_update_interval',
-                'CHART_TIMEFRAME': 'chart_timeframe',
-                'MAX_BARS_HISTORY': 'max_bars_history',
-                
-                # Auto-selection
-                'AUTO_SELECT_ENABLED': 'auto_select_enabled',
-                'AUTO_SELECT_MAX_SYMBOLS': 'auto_select_max_symbols',
-                'AUTO_SELECT_MIN_VOLUME': 'auto_select_min_volume',
-                'AUTO_SELECT_MIN_PRICE': 'auto_select_min_price',
-                'AUTO_SELECT_MAX_PRICE': 'auto_select_max_price',
-                'AUTO_SELECT_MIN_VOLATILITY': 'auto_select_min_volatility',
-                
-                # Logging
-                'LOG_LEVEL': 'log_level',
-                'LOG_TO_FILE': 'log_to_file',
-                'MAX_LOG_FILES': 'max_log_files',
-                
-                # Trading mode
-                'trading_mode': 'trading_mode',
-            }
+            # Read every variable first so invalid input leaves settings untouched
+            updates = [
+                (setting_name, self.config_vars[var_name].get())
+                for setting_name, var_name in _SAVE_MAPPING.items()
+                if var_name in self.config_vars
+            ]
             
-            # Update settings
-            for setting_name, var_name in settings_mapping.items():
-                if var_name in self.config_vars:
-                    value = self.config_vars[var_name].get()
+            # Update settings from config variables
+            changed = False
+            for setting_name, value in updates:
+                if getattr(self.settings, setting_name, _MISSING) != value:
                     setattr(self.settings, setting_name, value)
+                    changed = True
             
             # Notify of settings change
-            if self.on_settings_change:
+            if changed and self.on_settings_change:
                 config_dict = self._get_current_config()
                 self.on_settings_change(config_dict)
             
-            # Save settings to .env file for persistence
-            if self.settings.save_to_env_file():
-                messagebox.showinfo("Success", "Settings saved successfully and persisted to .env file!")
-                self.logger.info("Settings saved successfully and persisted to .env file")
+            # Save settings to .env file for persistence; compare against what
+            # was last written, so a failed save can be retried
+            values = self.settings.env_file_values()
+            if self._persist_running:
+                self._persist_queued = values
+                self.logger.info("Save in progress; queued the latest settings")
+            elif values != self._saved_env_values:
+                self._start_persist(values)
+            elif changed:
+                messagebox.showinfo("Success", "Settings applied. None of the changes are stored in the .env file.")
+                self.logger.info("Settings applied; .env values unchanged, file not rewritten")
             else:
-                messagebox.showwarning("Partial Success", "Settings saved to memory but failed to persist to .env file.")
-                self.logger.warning("Settings saved to memory but failed to persist to .env file")
+                messagebox.showinfo("No Changes", "No changes to save.")
+                self.logger.info("Settings unchanged; .env file not rewritten")
             
         except Exception as e:
-            self.logger.error(f"Error saving settings: {e}")
+            self.logger.error("Error saving settings: %s", e)
             messagebox.showerror("Error", f"Failed to save settings: {e}")
     
+    def _start_persist(self, values: Dict[str, str]) -> None:
+        """Write settings to the .env file off the Tk thread.
+        
+        Args:
+            values: Snapshot from Settings.env_file_values(), taken on the Tk
+                thread so the worker never reads settings being edited.
+        """
+        self._persist_running = True
+        self.logger.info("Saving settings to .env file...")
+        threading.Thread(target=self._persist_settings, args=(values,), daemon=True).start()
+    
+    def _persist_settings(self, values: Dict[str, str]) -> None:
+        """Write settings to the .env file (runs in a background thread).
+        
+        Args:
+            values: .env values to write.
+        """
+        try:
+            saved = self.settings.save_to_env_file(values=values)
+        except Exception as e:
+            self.logger.error("Error saving settings: %s", e)
+            self.frame.after(0, self._persist_settings_done, False, values)
+            return
+        
+        # Report back on the Tk thread
+        self.frame.after(0, self._persist_settings_done, saved, values)
+    
+    def _persist_settings_done(self, saved: bool, values: Dict[str, str]) -> None:
+        """Report the result of a background .env save.
+        
+        Args:
+            saved: Whether the .env file was written successfully.
+            values: .env values that were written.
+        """
+        from tkinter import messagebox
+        
+        self._persist_running = False
+        if saved:
+            self._saved_env_values = values
+        queued, self._persist_queued = self._persist_queued, None
+        if queued is not None and queued != self._saved_env_values:
+            # Newer values were saved meanwhile; report once they are written
+            self._start_persist(queued)
+            return
+        
+        if saved:
+            messagebox.showinfo("Success", "Settings saved successfully and persisted to .env file!")
+            self.logger.info("Settings saved successfully and persisted to .env file")
+        else:
+            messagebox.showwarning("Partial Success", "Settings saved to memory but failed to persist to .env file.")
+            self.logger.warning("Settings saved to memory but failed to persist to .env file")
+    
     def _load_settings_from_file(self) -> None:
         """Load settings from file."""
+        from tkinter import messagebox
+        
         try:
             # This would reload from .env or config file
             self.settings.reload()
+            self._saved_env_values = self.settings.env_file_values()
             self._load_settings()
             messagebox.showinfo("Success", "Settings reloaded from file!")
             
         except Exception as e:
-            self.logger.error(f"Error reloading settings: {e}")
+            self.logger.error("Error reloading settings: %s", e)
             messagebox.showerror("Error", f"Failed to reload settings: {e}")
     
-    def _get_current_config(self) -> Dict:
-        """Get current configuration as a dictionary.
+    def _on_var_write(self, name: str, *args) -> None:
+        """Handle a write to any configuration variable.
+        
+        Args:
+            name: Name of the variable that was written.
+            *args: Variable trace arguments (unused).
+        """
+        self._config_cache = None
+    
+    def _get_current_config(self) -> Dict[str, Any]:
+        """Get current configuration values, cached until a variable is written.
+        
+        Callers must not modify the returned dictionary.
         
         Returns:
             Dictionary containing current configuration values.
-        """
-        config = {}
-        try:
-            # Get all current values from config variables
-            for var_name, var in self.config_vars.items():
-                config[var_name] = var.get()
-            
-            self.logger.debug(f"Current config retrieved: {len(config)} settings")
-            return config
             
-        except Exception as e:
-            self.logger.error(f"Error getting current config: {e}")
-            return {}
+        Raises:
+            tk.TclError: If a variable holds a value that can't be converted.
+        """
+        if self._config_cache is None:
+            self._config_cache = {
+                var_name: self.config_vars.get_value(var_name)
+                for var_name in self.config_vars
+            }
+        return self._config_cache
     
     def _reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
+        from tkinter import messagebox
+        
         try:
             result = messagebox.askyesno(
                 "Confirm Reset",
@@ -991,16 +1302,19 @@ class ConfigPanel:
             
             if result:
                 # Reset all config variables to their default values
-                self._create_config_vars()
+                with self._batched_updates():
+                    self.config_vars.reset()
                 messagebox.showinfo("Success", "Settings reset to defaults!")
                 self.logger.info("Settings reset to defaults")
             
         except Exception as e:
-            self.logger.error(f"Error resetting settings: {e}")
+            self.logger.error("Error resetting settings: %s", e)
             messagebox.showerror("Error", f"Failed to reset settings: {e}")
     
     def _export_config(self) -> None:
         """Export configuration to JSON file."""
+        from tkinter import filedialog, messagebox
+        
         try:
             filename = filedialog.asksaveasfilename(
                 title="Export Configuration",
@@ -1009,22 +1323,19 @@ class ConfigPanel:
             )
             
             if filename:
-                config_data = {}
-                for var_name, var in self.config_vars.items():
-                    config_data[var_name] = var.get()
-                
-                with open(filename, 'w') as f:
-                    json.dump(config_data, f, indent=2)
+                _write_json(filename, self._get_current_config())
                 
                 messagebox.showinfo("Success", f"Configuration exported to {filename}")
-                self.logger.info(f"Configuration exported to {filename}")
+                self.logger.info("Configuration exported to %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Error exporting configuration: {e}")
+            self.logger.error("Error exporting configuration: %s", e)
             messagebox.showerror("Error", f"Failed to export configuration: {e}")
     
     def _import_config(self) -> None:
         """Import configuration from JSON file."""
+        from tkinter import filedialog, messagebox
+        
         try:
             filename = filedialog.askopenfilename(
                 title="Import Configuration",
@@ -1032,19 +1343,16 @@ class ConfigPanel:
             )
             
             if filename:
-                with open(filename, 'r') as f:
-                    config_data = json.load(f)
+                config_data = _read_json(filename)
                 
                 # Update config variables
-                for var_name, value in config_data.items():
-                    if var_name in self.config_vars:
-                        self.config_vars[var_name].set(value)
+                self._set_vars(config_data)
                 
                 messagebox.showinfo("Success", f"Configuration imported from {filename}")
-                self.logger.info(f"Configuration imported from {filename}")
+                self.logger.info("Configuration imported from %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Error importing configuration: {e}")
+            self.logger.error("Error importing configuration: %s", e)
             messagebox.showerror("Error", f"Failed to import configuration: {e}")
     
     def get_config_dict(self) -> Dict[str, Any]:
@@ -1053,10 +1361,7 @@ class ConfigPanel:
         Returns:
             Configuration dictionary.
         """
-        config = {}
-        for var_name, var in self.config_vars.items():
-            config[var_name] = var.get()
-        return config
+        return dict(self._get_current_config())
     
     def set_config_dict(self, config: Dict[str, Any]) -> None:
         """Set configuration from dictionary.
@@ -1064,6 +1369,21 @@ class ConfigPanel:
         Args:
             config: Configuration dictionary.
         """
-        for var_name, value in config.items():
-            if var_name in self.config_vars:
-                self.config_vars[var_name].set(value)
\ No newline at end of file
+        self._set_vars(config)
+    
+    def _set_vars(self, values: Mapping[str, Any]) -> None:
+        """Set config variables from a mapping in one batch.
+        
+        Unknown keys are ignored, and variables already holding the given
+        value are not written, so they fire no traces. Current values come
+        from the cached _get_current_config(), so no variable is read back.
+        
+        Args:
+            values: Variable name to new value.
+        """
+        current = self._config_snapshot()
+        with self._batched_updates():
+            for var_name in values.keys() & self.config_vars.keys():
+                value = values[var_name]
+                if current.get(var_name, _MISSING) != value:
+                    self.config_vars[var_name].set(value)
\ No newline at end of file
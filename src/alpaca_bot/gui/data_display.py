@@ -7,16 +7,15 @@ This module provides:
 - Trade execution markers
 """
 
+import heapq
 import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Optional, Any
+from typing import Dict, Hashable, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-import threading
-import time
 
 try:
-    import matplotlib.pyplot as plt
+    import numpy as np
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
     import matplotlib.dates as mdates
@@ -24,6 +23,7 @@ try:
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+from ..config.settings import get_settings
 from ..utils.logging_utils import get_logger
 from ..models.stock import StockData, StockBar, StockQuote
 from ..models.trade import Trade, Position
@@ -32,11 +32,16 @@ from ..models.trade import Trade, Position
 class DataDisplay:
     """Real-time data display component."""
     
-    def __init__(self, parent: tk.Widget):
+    # Number of trades listed in the Recent Trades table
+    _MAX_RECENT_TRADES = 20
+    
+    def __init__(self, parent: tk.Widget, update_interval: Optional[float] = None):
         """Initialize the data display.
         
         Args:
             parent: Parent widget.
+            update_interval: Seconds between automatic refreshes. If None,
+                follows the DATA_REFRESH_INTERVAL setting.
         """
         self.logger = get_logger(__name__)
         
@@ -47,8 +52,20 @@ class DataDisplay:
         # Data storage
         self.current_data: Dict[str, StockData] = {}
         self.price_history: Dict[str, List[StockBar]] = {}
+        
+        # Chart columns per symbol: (source bars, last bar key, times, closes, volumes)
+        self.price_arrays: Dict[str, Tuple[List[StockBar], Any, Any, Any, Any]] = {}
         self.trades: List[Trade] = []
         self.positions: List[Position] = []
+        self._recent_trades: List[Trade] = []  # Newest first, at most _MAX_RECENT_TRADES
+        
+        # Treeview rows shown: row key -> (item id, values), in display order
+        self._position_rows: Dict[Hashable, Tuple[str, Tuple[str, ...]]] = {}
+        self._trade_rows: Dict[Hashable, Tuple[str, Tuple[str, ...]]] = {}
+        
+        # Formatted row values by row key, with the raw fields they were made from
+        self._position_values: Dict[str, Tuple[Tuple[Any, ...], Tuple[str, ...]]] = {}
+        self._trade_values: Dict[Hashable, Tuple[Tuple[Any, ...], Tuple[str, ...]]] = {}
         
         # Display settings
         self.selected_symbol = tk.StringVar(value="AAPL")
@@ -56,11 +73,14 @@ class DataDisplay:
         self.show_indicators = tk.BooleanVar(value=True)
         self.show_trades = tk.BooleanVar(value=True)
         
+        # Plain copy of the selected symbol for the per-update symbol checks
+        self._selected_symbol = self.selected_symbol.get()
+        self.selected_symbol.trace_add('write', self._on_selected_symbol_write)
+        
         # Update control
         self.auto_update = tk.BooleanVar(value=True)
-        self.update_interval = 5  # seconds
-        self._update_thread = None
-        self._stop_update = threading.Event()
+        self.update_interval = update_interval  # seconds; None follows settings
+        self._update_after_id: Optional[str] = None
         
         self._create_widgets()
         
@@ -150,17 +170,22 @@ class DataDisplay:
         self._create_performance_display()
     
     def _setup_chart(self) -> None:
-        """Set up the matplotlib chart."""
+        """Set up the matplotlib chart.
+        
+        The plotted artists are created once and marked animated: a full
+        draw renders only the static axes, which are cached and blitted
+        under the artists on each refresh.
+        """
         if not MATPLOTLIB_AVAILABLE:
             return
         
-        # Create figure and axis
+        # Create figure and axes (volume shares the time axis)
         self.fig = Figure(figsize=(12, 8), dpi=100)
         self.ax = self.fig.add_subplot(111)
+        self.volume_ax = self.ax.twinx()
         
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, self.chart_frame)
-        self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Configure chart appearance
@@ -168,15 +193,80 @@ class DataDisplay:
         self.ax.set_xlabel("Time")
         self.ax.set_ylabel("Price ($)")
         self.ax.grid(True, alpha=0.3)
+        self.volume_ax.set_ylabel('Volume')
+        self.volume_ax.tick_params(axis='y', labelcolor='gray')
         
         # Format x-axis for time
+        self.ax.xaxis_date()
         self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
         self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=30))
+        self.ax.tick_params(axis='x', labelrotation=45)
+        
+        # Plotted artists, updated in place by update_chart
+        self.volume_bars = self.volume_ax.vlines([], 0, [], colors='gray', alpha=0.3, animated=True)
+        self.price_line, = self.ax.plot([], [], linewidth=2, color='blue', label='Price', animated=True)
+        self.ma_line, = self.ax.plot([], [], linewidth=1, color='red', alpha=0.7, label='MA(20)', animated=True)
+        self.buy_markers = self.ax.scatter(
+            [], [], color='green', marker='^', s=100, alpha=0.8, label='BUY', animated=True
+        )
+        self.sell_markers = self.ax.scatter(
+            [], [], color='red', marker='v', s=100, alpha=0.8, label='SELL', animated=True
+        )
+        self._chart_artists = (
+            self.volume_bars, self.price_line, self.ma_line, self.buy_markers, self.sell_markers
+        )
+        
+        self.no_data_text = self.ax.text(
+            0.5, 0.5, 'No data available',
+            horizontalalignment='center', verticalalignment='center',
+            transform=self.ax.transAxes, fontsize=14, visible=False
+        )
         
-        plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45)
+        # Static chart state behind the cached background
+        self._chart_background = None
+        self._chart_layout = None
         
+        # Inputs of the last update_chart call, to skip unchanged refreshes
+        self._chart_inputs: Optional[Tuple[Any, ...]] = None
+        self.canvas.mpl_connect('draw_event', self._on_chart_draw)
+        
+        # Fixed margins; the layout is only re-solved when the canvas is resized
+        self.fig.subplots_adjust(left=0.08, right=0.92, bottom=0.15, top=0.92)
+        self.canvas.mpl_connect('resize_event', self._on_chart_resize)
+        self.canvas.draw()
+    
+    def _on_chart_draw(self, event) -> None:
+        """Cache the static chart after a full draw and draw the artists over it.
+        
+        Args:
+            event: Matplotlib draw event.
+        """
+        self._chart_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_chart_artists()
+    
+    def _on_chart_resize(self, event) -> None:
+        """Fit the chart layout to the new canvas size.
+        
+        Args:
+            event: Matplotlib resize event.
+        """
         self.fig.tight_layout()
     
+    def _draw_chart_artists(self) -> None:
+        """Draw the animated chart artists onto the canvas."""
+        for artist in self._chart_artists:
+            self.fig.draw_artist(artist)
+    
+    def _blit_chart(self) -> None:
+        """Redraw the chart artists over the cached static background."""
+        if self._chart_background is None:
+            self.canvas.draw()
+            return
+        
+        self.canvas.restore_region(self._chart_background)
+        self._draw_chart_artists()
+        self.canvas.blit(self.fig.bbox)
+    
     def _show_no_matplotlib_message(self) -> None:
         """Show message when matplotlib is not available."""
         message_frame = ttk.Frame(self.chart_frame)
@@ -344,7 +434,7 @@ class DataDisplay:
             quote: Quote data.
         """
         try:
-            if symbol != self.selected_symbol.get():
+            if symbol != self._selected_symbol:
                 return
             
             # Update price labels
@@ -387,7 +477,7 @@ class DataDisplay:
             stock_data: Stock data with indicators.
         """
         try:
-            if symbol != self.selected_symbol.get():
+            if symbol != self._selected_symbol:
                 return
             
             if not stock_data.indicators:
@@ -423,17 +513,24 @@ class DataDisplay:
             positions: List of current positions.
         """
         try:
-            # Clear existing items
-            for item in self.position_tree.get_children():
-                self.position_tree.delete(item)
-            
-            # Add current positions
+            rows = []
+            cached = self._position_values
+            self._position_values = {}
             for position in positions:
-                # Calculate current P&L (would need current price)
+                # Reuse the formatted row if its inputs haven't changed
                 current_price = position.current_price or position.avg_price
+                raw = (position.quantity, position.avg_price, current_price)
+                entry = cached.get(position.symbol)
+                if entry is not None and entry[0] == raw:
+                    self._position_values[position.symbol] = entry
+                    rows.append((position.symbol, entry[1]))
+                    continue
+                
+                # Calculate current P&L (would need current price)
                 if current_price is not None and position.avg_price is not None and position.avg_price > 0:
+                    cost = position.avg_price * position.quantity
                     pnl = (current_price - position.avg_price) * position.quantity
-                    pnl_pct = (pnl / (position.avg_price * position.quantity)) * 100
+                    pnl_pct = (pnl / cost) * 100
                 else:
                     pnl = 0.0
                     pnl_pct = 0.0
@@ -442,23 +539,20 @@ class DataDisplay:
                 dollar_value = abs(position.quantity) * current_price if current_price is not None else 0.0
                 
                 # Format values with dollar value as primary display
+                # Note: Treeview doesn't support easy color coding, would need custom styling
                 values = (
                     position.symbol,
                     f"${dollar_value:,.2f}",
                     f"{position.quantity:,}",
                     f"${position.avg_price:.2f}",
                     f"${current_price:.2f}",
-                    f"${pnl:+.2f}",
+                    f"${pnl:.2f}" if pnl > 0 else f"${pnl:+.2f}",
                     f"{pnl_pct:+.1f}%"
                 )
-                
-                # Add to tree with color coding
-                item = self.position_tree.insert('', tk.END, values=values)
-                
-                # Color code based on P&L
-                if pnl > 0:
-                    self.position_tree.set(item, 'P&L', f"${pnl:.2f}")
-                    # Note: Treeview doesn't support easy color coding, would need custom styling
+                self._position_values[position.symbol] = (raw, values)
+                rows.append((position.symbol, values))
+            
+            self._sync_tree(self.position_tree, self._position_rows, rows)
             
         except Exception as e:
             self.logger.error(f"Error updating positions display: {e}")
@@ -469,15 +563,49 @@ class DataDisplay:
         Args:
             trades: List of recent trades.
         """
-        try:
-            # Clear existing items
-            for item in self.trades_tree.get_children():
-                self.trades_tree.delete(item)
-            
-            # Add recent trades (last 20)
-            recent_trades = sorted(trades, key=lambda t: t.timestamp, reverse=True)[:20]
+        self._recent_trades = heapq.nlargest(self._MAX_RECENT_TRADES, trades, key=self._trade_time)
+        self._show_recent_trades()
+    
+    def add_trade(self, trade: Trade) -> None:
+        """Add a newly executed trade to the display.
+        
+        Args:
+            trade: Trade to add.
+        """
+        self.trades.append(trade)
+        self._recent_trades = heapq.nlargest(
+            self._MAX_RECENT_TRADES, self._recent_trades + [trade], key=self._trade_time
+        )
+        self._show_recent_trades()
+    
+    @staticmethod
+    def _trade_time(trade: Trade) -> Tuple[bool, Optional[datetime]]:
+        """Get the sort key of a trade, ordering trades without a timestamp oldest.
+        
+        Args:
+            trade: Trade to sort.
             
-            for trade in recent_trades:
+        Returns:
+            Sort key comparing by timestamp.
+        """
+        return trade.timestamp is not None, trade.timestamp
+    
+    def _show_recent_trades(self) -> None:
+        """Show the most recent trades in the trades table."""
+        try:
+            rows = []
+            cached = self._trade_values
+            self._trade_values = {}
+            for trade in self._recent_trades:
+                # Reuse the formatted row if the trade hasn't changed
+                key = (trade.order_id or trade.timestamp, trade.symbol)
+                raw = (trade.timestamp, trade.trade_type, trade.quantity, trade.price, trade.pnl)
+                entry = cached.get(key)
+                if entry is not None and entry[0] == raw:
+                    self._trade_values[key] = entry
+                    rows.append((key, entry[1]))
+                    continue
+                
                 # Format values
                 time_str = trade.timestamp.strftime('%H:%M:%S') if trade.timestamp else '--'
                 pnl_str = f"${trade.pnl:.2f}" if trade.pnl is not None else '--'
@@ -490,127 +618,280 @@ class DataDisplay:
                     f"${trade.price:.2f}",
                     pnl_str
                 )
-                
-                self.trades_tree.insert('', tk.END, values=values)
+                self._trade_values[key] = (raw, values)
+                rows.append((key, values))
+            
+            self._sync_tree(self.trades_tree, self._trade_rows, rows)
             
         except Exception as e:
             self.logger.error(f"Error updating trades display: {e}")
     
+    def _sync_tree(self, tree: ttk.Treeview, shown: Dict[Hashable, Tuple[str, Tuple[str, ...]]],
+                   rows: Iterable[Tuple[Hashable, Tuple[str, ...]]]) -> None:
+        """Update a Treeview to show the given rows, touching only rows that changed.
+        
+        Args:
+            tree: Treeview to update.
+            shown: Rows currently in the tree, updated in place.
+            rows: (key, values) pairs in display order.
+        """
+        previous = dict(shown)
+        shown.clear()
+        seen: Dict[Hashable, int] = {}
+        inserted = []
+        
+        for key, values in rows:
+            # Tell apart rows that share a key by their occurrence
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            key = (key, occurrence)
+            
+            entry = previous.get(key)
+            if entry is None:
+                item = tree.insert('', tk.END, values=values)
+                inserted.append(key)
+            else:
+                item, old_values = entry
+                if old_values != values:
+                    tree.item(item, values=values)
+            shown[key] = (item, values)
+        
+        stale = [item for key, (item, _) in previous.items() if key not in shown]
+        if stale:
+            tree.delete(*stale)
+        
+        # Kept rows stay in their old order with new rows appended; move only if that's wrong
+        tree_order = [key for key in previous if key in shown] + inserted
+        if tree_order != list(shown):
+            for index, (item, _) in enumerate(shown.values()):
+                tree.move(item, '', index)
+    
     def update_chart(self, symbol: str, bars: List[StockBar]) -> None:
         """Update price chart.
         
+        Only the plotted artists are redrawn, unless the axis limits, title
+        or legend changed, in which case the whole figure is redrawn. Axis
+        limits are widened in steps with headroom, so appended bars usually
+        fit the current axes and can be blitted.
+        
         Args:
             symbol: Stock symbol.
             bars: Price bar data.
         """
-        if not MATPLOTLIB_AVAILABLE or symbol != self.selected_symbol.get():
+        if not MATPLOTLIB_AVAILABLE or symbol != self._selected_symbol:
             return
         
+        # Nothing to redraw if the same bars, trades and options are shown;
+        # the lists are compared by identity first, lengths catch appends and
+        # the last bar catches rolling windows and an updated current bar
+        show_indicators = self.show_indicators.get()
+        show_trades = self.show_trades.get()
+        timeframe = self.chart_timeframe.get()
+        inputs = (
+            symbol, timeframe, show_indicators, show_trades,
+            bars, len(bars), self._last_bar_key(bars), self.trades, len(self.trades),
+        )
+        if inputs == self._chart_inputs:
+            return
+        self._chart_inputs = inputs
+        
         try:
-            # Clear previous plot
-            self.ax.clear()
-            
-            if not bars:
-                self.ax.text(0.5, 0.5, 'No data available', 
-                           horizontalalignment='center', verticalalignment='center',
-                           transform=self.ax.transAxes, fontsize=14)
-                self.canvas.draw()
-                return
-            
             # Extract data
-            times = [bar.timestamp for bar in bars]
-            prices = [bar.close for bar in bars]
-            volumes = [bar.volume for bar in bars]
-            
-            # Plot price line
-            self.ax.plot(times, prices, linewidth=2, color='blue', label='Price')
+            times, prices, volumes = self._bar_arrays(symbol, bars)
             
-            # Add volume bars (scaled)
-            if volumes and max(volumes) > 0:
-                ax2 = self.ax.twinx()
-                ax2.bar(times, volumes, alpha=0.3, color='gray', width=0.0001)
-                ax2.set_ylabel('Volume')
-                ax2.tick_params(axis='y', labelcolor='gray')
+            # Plot price line and volume bars
+            self.price_line.set_data(times, prices)
+            bar_bottoms = np.column_stack((times, np.zeros_like(volumes)))
+            bar_tops = np.column_stack((times, volumes))
+            self.volume_bars.set_segments(np.stack((bar_bottoms, bar_tops), axis=1))
+            max_volume = volumes.max() if len(volumes) else 0
+            self.volume_bars.set_visible(max_volume > 0)
             
             # Add technical indicators if enabled
-            if self.show_indicators.get():
-                self._add_chart_indicators(times, bars)
+            self.ma_line.set_visible(show_indicators)
+            if show_indicators:
+                self._add_chart_indicators(times, prices)
             
             # Add trade markers if enabled
-            if self.show_trades.get():
-                self._add_trade_markers()
+            self.buy_markers.set_visible(show_trades)
+            self.sell_markers.set_visible(show_trades)
+            if show_trades:
+                self._add_trade_markers(symbol)
+            
+            # Fit the axes to the visible data
+            legend_artists = [self.price_line] if bars else []
+            if show_indicators and len(self.ma_line.get_xdata()):
+                legend_artists.append(self.ma_line)
+            
+            self.no_data_text.set_visible(not bars)
+            xs, ys = [times], [prices]
+            if show_trades:
+                for markers in (self.buy_markers, self.sell_markers):
+                    offsets = markers.get_offsets()
+                    if len(offsets):
+                        xs.append(offsets[:, 0])
+                        ys.append(offsets[:, 1])
+                        legend_artists.append(markers)
+            self._fit_chart_limits(np.concatenate(xs), np.concatenate(ys), max_volume)
+            
+            # Minute tick spacing grows with the number of bars
+            locator_interval = max(1, len(times) // 10) if len(times) > 20 else None
+            
+            layout = (
+                symbol, timeframe, locator_interval, tuple(legend_artists),
+                self.ax.get_xlim(), self.ax.get_ylim(), self.volume_ax.get_ylim(), bool(bars),
+            )
+            if layout == self._chart_layout:
+                self._blit_chart()
+                return
+            self._chart_layout = layout
             
             # Configure chart
-            self.ax.set_title(f"{symbol} - {self.chart_timeframe.get()}")
-            self.ax.set_xlabel("Time")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            self.ax.legend()
+            self.ax.set_title(f"{symbol} - {timeframe}")
+            if locator_interval is None:
+                self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+            else:
+                self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=locator_interval))
+            
+            legend = self.ax.get_legend()
+            if legend is not None:
+                legend.remove()
+            if legend_artists:
+                self.ax.legend(handles=legend_artists)
             
-            # Format x-axis
-            self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            if len(times) > 20:
-                self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=max(1, len(times)//10)))
-            
-            plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45)
-            
-            self.fig.tight_layout()
             self.canvas.draw()
             
         except Exception as e:
             self.logger.error(f"Error updating chart: {e}")
     
-    def _add_chart_indicators(self, times: List[datetime], bars: List[StockBar]) -> None:
-        """Add technical indicators to chart.
+    def _fit_chart_limits(self, xs: Any, ys: Any, max_volume: float) -> None:
+        """Fit the axis limits to the plotted data in steps.
+        
+        Limits are only changed when the data no longer fits or leaves much
+        of the axes empty, and are then set with headroom to the right and
+        around the price range, so most refreshes keep the same limits.
+        
+        Args:
+            xs: X values of the plotted points.
+            ys: Y values of the plotted points.
+            max_volume: Largest plotted volume.
+        """
+        if len(xs):
+            lo, hi = xs.min(), xs.max()
+            span = max(hi - lo, 1 / 1440)  # at least a minute
+            left, right = self.ax.get_xlim()
+            if lo < left or hi > right or lo - left > 0.25 * span or right - hi > 0.5 * span:
+                self.ax.set_xlim(lo - 0.02 * span, hi + 0.25 * span)
+        
+        if len(ys):
+            lo, hi = ys.min(), ys.max()
+            span = max(hi - lo, abs(hi) * 0.001, 1e-6)
+            bottom, top = self.ax.get_ylim()
+            if lo < bottom or hi > top or top - bottom > 1.6 * span:
+                self.ax.set_ylim(lo - 0.1 * span, hi + 0.1 * span)
+        
+        top = self.volume_ax.get_ylim()[1]
+        if max_volume <= 0:
+            if top != 1:
+                self.volume_ax.set_ylim(0, 1)
+        elif max_volume > top or top > 2.5 * max_volume:
+            self.volume_ax.set_ylim(0, max_volume * 1.25)
+    
+    def _bar_arrays(self, symbol: str, bars: List[StockBar]) -> Tuple[Any, Any, Any]:
+        """Get the chart columns of a bar list, converting it only once.
+        
+        The cache is reused while the list object, its length and its last bar
+        are unchanged; callers changing earlier bars must pass a new list.
+        
+        Args:
+            symbol: Stock symbol.
+            bars: Price bar data.
+            
+        Returns:
+            Bar times as matplotlib date numbers, close prices and volumes.
+        """
+        last_bar = self._last_bar_key(bars)
+        cached = self.price_arrays.get(symbol)
+        if (cached is not None and cached[0] is bars and len(cached[2]) == len(bars)
+                and cached[1] == last_bar):
+            return cached[2:]
+        
+        count = len(bars)
+        times = mdates.date2num([bar.timestamp for bar in bars]) if bars else np.empty(0)
+        closes = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=count)
+        volumes = np.fromiter((bar.volume for bar in bars), dtype=np.float64, count=count)
+        
+        self.price_arrays[symbol] = (bars, last_bar, times, closes, volumes)
+        return times, closes, volumes
+    
+    @staticmethod
+    def _last_bar_key(bars: List[StockBar]) -> Optional[Tuple[Any, float, float]]:
+        """Get the fields of the last bar that the bar caches are keyed on.
         
         Args:
-            times: Time data.
             bars: Price bar data.
+            
+        Returns:
+            Timestamp, close and volume of the last bar, or None if there are no bars.
+        """
+        if not bars:
+            return None
+        last = bars[-1]
+        return (last.timestamp, last.close, last.volume)
+    
+    def _add_chart_indicators(self, times: Any, closes: Any) -> None:
+        """Add technical indicators to chart.
+        
+        Args:
+            times: Bar times as matplotlib date numbers.
+            closes: Bar close prices as a float array.
         """
         try:
             # This would calculate and plot indicators
             # For now, just add placeholder moving averages
-            if len(bars) >= 20:
-                # Simple 20-period moving average
-                ma_20 = []
-                for i in range(len(bars)):
-                    if i >= 19:
-                        avg = sum(bar.close for bar in bars[i-19:i+1]) / 20
-                        ma_20.append(avg)
-                    else:
-                        ma_20.append(None)
-                
-                # Plot moving average
-                valid_times = [t for t, ma in zip(times, ma_20) if ma is not None]
-                valid_ma = [ma for ma in ma_20 if ma is not None]
-                
-                if valid_times and valid_ma:
-                    self.ax.plot(valid_times, valid_ma, linewidth=1, color='red', 
-                               alpha=0.7, label='MA(20)')
+            valid_times: Any = ()
+            valid_ma: Any = ()
+            if len(closes) >= 20:
+                # Simple 20-period moving average from a running sum
+                cumsum = np.cumsum(np.insert(closes, 0, 0.0))
+                valid_ma = (cumsum[20:] - cumsum[:-20]) / 20.0
+                valid_times = times[19:]
+            
+            # Plot moving average
+            self.ma_line.set_data(valid_times, valid_ma)
             
         except Exception as e:
             self.logger.error(f"Error adding chart indicators: {e}")
     
-    def _add_trade_markers(self) -> None:
-        """Add trade execution markers to chart."""
+    def _add_trade_markers(self, symbol: str) -> None:
+        """Add trade execution markers to chart.
+        
+        Args:
+            symbol: Stock symbol shown on the chart.
+        """
         try:
-            symbol = self.selected_symbol.get()
-            
             # Filter trades for current symbol
-            symbol_trades = [t for t in self.trades if t.symbol == symbol]
+            buys = []
+            sells = []
+            for trade in self.trades:
+                if trade.symbol == symbol and trade.timestamp and trade.price:
+                    points = buys if trade.trade_type.value == 'buy' else sells
+                    points.append((mdates.date2num(trade.timestamp), trade.price))
             
-            for trade in symbol_trades:
-                if trade.timestamp and trade.price:
-                    color = 'green' if trade.trade_type.value == 'buy' else 'red'
-                    marker = '^' if trade.trade_type.value == 'buy' else 'v'
-                    
-                    self.ax.scatter(trade.timestamp, trade.price, 
-                                  color=color, marker=marker, s=100, alpha=0.8,
-                                  label=f'{trade.trade_type.value.upper()}' if trade == symbol_trades[0] else "")
+            self.buy_markers.set_offsets(np.array(buys, dtype=float).reshape(-1, 2))
+            self.sell_markers.set_offsets(np.array(sells, dtype=float).reshape(-1, 2))
             
         except Exception as e:
             self.logger.error(f"Error adding trade markers: {e}")
     
+    def _on_selected_symbol_write(self, *args) -> None:
+        """Keep the cached selected symbol in sync with its variable.
+        
+        Args:
+            *args: Variable trace arguments (unused).
+        """
+        self._selected_symbol = self.selected_symbol.get()
+    
     def _on_symbol_change(self, event=None) -> None:
         """Handle symbol selection change."""
         self._refresh_data()
@@ -623,7 +904,7 @@ class DataDisplay:
         """Handle display option changes."""
         if MATPLOTLIB_AVAILABLE:
             # Redraw chart with new options
-            symbol = self.selected_symbol.get()
+            symbol = self._selected_symbol
             if symbol in self.price_history:
                 self.update_chart(symbol, self.price_history[symbol])
     
@@ -636,40 +917,41 @@ class DataDisplay:
     
     def _start_auto_update(self) -> None:
         """Start automatic data updates."""
-        if self._update_thread and self._update_thread.is_alive():
+        if self._update_after_id is not None:
             return
         
-        self._stop_update.clear()
-        self._update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self._update_thread.start()
+        # Refresh right away, then every update_interval seconds
+        self._update_after_id = self.frame.after(0, self._update_tick)
         
         self.logger.info("Started auto-update for data display")
     
     def _stop_auto_update(self) -> None:
         """Stop automatic data updates."""
-        self._stop_update.set()
-        
-        if self._update_thread and self._update_thread.is_alive():
-            self._update_thread.join(timeout=1.0)
+        if self._update_after_id is not None:
+            self.frame.after_cancel(self._update_after_id)
+            self._update_after_id = None
         
         self.logger.info("Stopped auto-update for data display")
     
-    def _update_loop(self) -> None:
-        """Auto-update loop."""
-        while not self._stop_update.is_set():
-            try:
-                self._refresh_data()
-                time.sleep(self.update_interval)
-            except Exception as e:
-                self.logger.error(f"Error in update loop: {e}")
-                time.sleep(self.update_interval)
+    def _update_tick(self) -> None:
+        """Refresh the display and schedule the next auto-update on the Tk main loop."""
+        self._update_after_id = None
+        self._refresh_data()
+        
+        if self.auto_update.get():
+            interval = self.update_interval
+            if interval is None:
+                # Re-read each tick so a changed setting applies without a restart
+                interval = get_settings().data_refresh_interval
+            interval = max(1.0, float(interval))
+            self._update_after_id = self.frame.after(int(interval * 1000), self._update_tick)
     
     def _refresh_data(self) -> None:
         """Refresh displayed data."""
         try:
             # This would normally fetch fresh data from the API
             # For now, just update the display with existing data
-            symbol = self.selected_symbol.get()
+            symbol = self._selected_symbol
             
             if symbol in self.current_data:
                 stock_data = self.current_data[symbol]
@@ -702,7 +984,7 @@ class DataDisplay:
             self.price_history[symbol] = stock_data.bars
         
         # Update display if this is the selected symbol
-        if symbol == self.selected_symbol.get():
+        if symbol == self._selected_symbol:
             if stock_data.quote:
                 self.update_quote_data(symbol, stock_data.quote)
             
@@ -9,12 +9,13 @@ This module provides the main interface with:
 
 import logging
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..services.alpaca_client import AlpacaClient
 from ..strategies.scalping_strategy import ScalpingStrategy
 from ..utils.logging_utils import get_logger, setup_logging
@@ -48,6 +49,7 @@ class MainWindow:
         # Create main window
         self.root = tk.Tk()
         self.root.title("Alpaca Trading Bot")
+        settings = get_settings()
         self.root.geometry(f"{settings.window_width}x{settings.window_height}")
         self.root.minsize(800, 600)
         
@@ -217,8 +219,7 @@ class MainWindow:
         self._create_orders_display(orders_frame)
         
         # Configuration panel
-        from ..config.settings import settings
-        self.config_panel = ConfigPanel(notebook, settings, self._on_config_changed)
+        self.config_panel = ConfigPanel(notebook, get_settings(), self._on_config_changed)
     
     def _create_log_display(self, parent: ttk.Frame) -> None:
         """Create the log display.
@@ -568,6 +569,10 @@ class MainWindow:
         """Main trading loop."""
         def _run_trading_loop() -> None:
             """Internal function to run the trading loop."""
+            # Track the next deadline instead of sleeping a fixed interval after
+            # each pass, so processing time does not stretch the cycle.
+            next_tick = time.monotonic() + max(1.0, float(get_settings().data_refresh_interval))
+
             while self.is_trading:
                 # Update strategy positions
                 if self.strategy:
@@ -611,9 +616,18 @@ class MainWindow:
                         log_errors=True
                     )
                 
-                # Sleep between iterations
+                # Sleep until the next deadline
                 if self.is_trading:
-                    threading.Event().wait(5)  # 5-second interval
+                    # Re-read the interval each pass so a reloaded setting applies
+                    interval = max(1.0, float(get_settings().data_refresh_interval))
+                    now = time.monotonic()
+                    if next_tick <= now:
+                        # Iteration overran the interval; skip the missed ticks
+                        # and rest a full interval rather than firing
+                        # back-to-back passes to catch up.
+                        next_tick = now + interval
+                    threading.Event().wait(next_tick - now)
+                    next_tick += interval
         
         def _handle_loop_error(error: Exception) -> None:
             """Handle trading loop errors."""
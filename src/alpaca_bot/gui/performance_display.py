@@ -14,7 +14,6 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 try:
-    import matplotlib.pyplot as plt
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
     MATPLOTLIB_AVAILABLE = True
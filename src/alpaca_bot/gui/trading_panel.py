@@ -34,10 +34,12 @@ class TradingPanel:
         self.frame = ttk.LabelFrame(parent, text="Trading Panel", padding=8)
         self.frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Configure frame style for better visibility
-        style = ttk.Style()
-        style.configure('TradingPanel.TLabelframe', relief='raised', borderwidth=2)
-        style.configure('TradingPanel.TLabelframe.Label', font=('TkDefaultFont', 10, 'bold'))
+        # Configure frame style for better visibility; ttk styles belong to
+        # the Tk interpreter, so configure them once per interpreter
+        style = ttk.Style(self.frame)
+        if not style.lookup('TradingPanel.TLabelframe.Label', 'font'):
+            style.configure('TradingPanel.TLabelframe', relief='raised', borderwidth=2)
+            style.configure('TradingPanel.TLabelframe.Label', font=('TkDefaultFont', 10, 'bold'))
         self.frame.configure(style='TradingPanel.TLabelframe')
         
         # Trading statistics
@@ -13,7 +13,7 @@ import tkinter as tk
 from tkinter import messagebox
 from pathlib import Path
 
-from .config.settings import Settings
+from .config.settings import get_settings
 from .utils.logging_utils import setup_logging
 from .utils.error_handler import (
     ErrorHandler, TradingBotError, APIConnectionError,
@@ -31,7 +31,7 @@ def setup_application() -> None:
         logger.info("Starting Alpaca Trading Bot")
         
         # Load configuration
-        settings = Settings()
+        settings = get_settings()
         
         # Validate required settings
         if not settings.alpaca_api_key or not settings.alpaca_secret_key:
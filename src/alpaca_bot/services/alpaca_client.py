@@ -14,7 +14,7 @@ from alpaca_trade_api.common import URL
 from alpaca_trade_api.entity import Account, Asset, Order, Position
 from alpaca_trade_api.rest import APIError, REST
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..utils.error_handler import (
     ErrorHandler,
     APIConnectionError,
@@ -43,7 +43,7 @@ class AlpacaClient:
         self.error_handler = ErrorHandler(self.logger)
         
         try:
-            api_key, secret_key, base_url = settings.get_alpaca_credentials()
+            api_key, secret_key, base_url = get_settings().get_alpaca_credentials()
             
             self.api = REST(
                 key_id=api_key,
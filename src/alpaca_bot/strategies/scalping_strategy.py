@@ -16,7 +16,7 @@ from enum import Enum
 import pandas as pd
 from alpaca_trade_api.rest import REST
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..models.stock import StockData, StockQuote, SupportResistanceLevel, TechnicalIndicators
 from ..models.trade import Trade, TradeType, OrderType, TradeStatus
 from ..services.alpaca_client import AlpacaClient
@@ -164,6 +164,7 @@ class ScalpingStrategy:
         self.error_handler = ErrorHandler(self.logger)
         self.account_update_callback = account_update_callback
         self.order_update_callback = order_update_callback
+        settings = get_settings()
         self.settings = settings  # Add settings reference for dynamic parameter updates
         
         # Strategy parameters from settings
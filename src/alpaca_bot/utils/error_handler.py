@@ -8,7 +8,7 @@ import logging
 import time
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
 
 import requests
 from alpaca_trade_api.rest import APIError
@@ -210,6 +210,22 @@ class ErrorHandler:
             self.circuit_breakers.clear()
             self.logger.info("All error counts reset")
     
+    def reset_error_counts_many(self, operations: Iterable[str]) -> None:
+        """Reset error counts for several operations at once.
+        
+        Args:
+            operations: Operations to reset.
+        """
+        reset = []
+        for operation in operations:
+            self.error_counts.pop(operation, None)
+            self.last_error_times.pop(operation, None)
+            self.circuit_breakers.pop(operation, None)
+            reset.append(operation)
+        
+        if reset:
+            self.logger.info("Error counts reset for %s", ", ".join(reset))
+    
     def get_error_summary(self) -> Dict[str, Dict[str, Any]]:
         """Get summary of current error states.
         
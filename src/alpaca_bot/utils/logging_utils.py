@@ -9,9 +9,20 @@ import logging.handlers
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from ..config.settings import settings
+from ..config.settings import get_settings
+
+
+# Shared formatter for the application's console and file handlers
+_LOG_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# (level, log file, max file size, backup count) of the last setup_logging()
+# call, used to skip repeats
+_logging_config: Optional[Tuple[int, str, int, int]] = None
 
 
 def setup_logging(
@@ -22,15 +33,21 @@ def setup_logging(
 ) -> None:
     """Set up logging configuration for the application.
     
+    Repeated calls with the same level, log file and rotation settings are
+    no-ops, so the root logger's handlers are not torn down and rebuilt each time.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         log_file: Path to log file. If None, uses default from settings.
         max_file_size: Maximum size of log file before rotation.
         backup_count: Number of backup files to keep.
     """
+    global _logging_config
+    
     # Get log level from settings if not provided
     if log_level is None:
-        log_level = settings.log_level
+        log_level = get_settings().log_level
+    level = getattr(logging, log_level.upper(), logging.INFO)
     
     # Get log file path
     if log_file is None:
@@ -38,24 +55,24 @@ def setup_logging(
         log_dir.mkdir(exist_ok=True)
         log_file = log_dir / f"alpaca_bot_{datetime.now().strftime('%Y%m%d')}.log"
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Skip re-initialization if nothing changed
+    config_key = (level, str(log_file), max_file_size, backup_count)
+    if _logging_config == config_key:
+        return
     
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
     
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_LOG_FORMATTER)
     root_logger.addHandler(console_handler)
     
     # File handler with rotation
@@ -65,9 +82,10 @@ def setup_logging(
         backupCount=backup_count,
         encoding='utf-8'
     )
-    file_handler.setLevel(getattr(logging, log_level.upper()))
-    file_handler.setFormatter(formatter)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(_LOG_FORMATTER)
     root_logger.addHandler(file_handler)
+    _logging_config = config_key
     
     # Log startup message
     logger = logging.getLogger(__name__)
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime, time
 from typing import Tuple, Optional
 import pytz
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 
 class MarketHours:
@@ -37,6 +37,7 @@ class MarketHours:
         current_time = now_et.time()
         
         # Get trading hours from settings
+        settings = get_settings()
         start_hour = getattr(settings, 'trading_start_hour', 9)
         start_minute = getattr(settings, 'trading_start_minute', 30)
         end_hour = getattr(settings, 'trading_end_hour', 16)
@@ -67,6 +68,7 @@ class MarketHours:
             return False, f"Market closed (Weekend). Opens Monday at 9:30 AM ET"
         
         # Get trading hours from settings
+        settings = get_settings()
         start_hour = getattr(settings, 'trading_start_hour', 9)
         start_minute = getattr(settings, 'trading_start_minute', 30)
         end_hour = getattr(settings, 'trading_end_hour', 16)
@@ -98,6 +100,7 @@ class MarketHours:
         now_et = datetime.now(self.eastern_tz)
         
         # Get trading hours from settings
+        settings = get_settings()
         start_hour = getattr(settings, 'trading_start_hour', 9)
         start_minute = getattr(settings, 'trading_start_minute', 30)
         
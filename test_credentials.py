@@ -13,12 +13,12 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 try:
-    from decouple import config
+    from dotenv import dotenv_values
     import alpaca_trade_api as tradeapi
     from alpaca_trade_api.rest import APIError
 except ImportError as e:
     print(f"❌ Import error: {e}")
-    print("Please install required dependencies: pip install python-decouple alpaca-trade-api")
+    print("Please install required dependencies: pip install python-dotenv alpaca-trade-api")
     sys.exit(1)
 
 
@@ -27,11 +27,12 @@ def test_alpaca_credentials():
     print("🔍 Testing Alpaca API Credentials...")
     print("=" * 50)
     
-    # Load credentials from .env file
+    # Load credentials from .env file (environment variables take precedence)
     try:
-        api_key = config("ALPACA_API_KEY", default="")
-        secret_key = config("ALPACA_SECRET_KEY", default="")
-        base_url = config("ALPACA_BASE_URL", default="https://paper-api.alpaca.markets")
+        env = {**dotenv_values(Path(__file__).parent / ".env"), **os.environ}
+        api_key = env.get("ALPACA_API_KEY") or ""
+        secret_key = env.get("ALPACA_SECRET_KEY") or ""
+        base_url = env.get("ALPACA_BASE_URL") or "https://paper-api.alpaca.markets"
         
         print(f"📍 API Key: {api_key[:8]}...{api_key[-4:] if len(api_key) > 12 else 'INVALID'}")
         print(f"📍 Base URL: {base_url}")
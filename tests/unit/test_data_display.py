@@ -0,0 +1,105 @@
+"""Tests for the data display's chart helpers."""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from src.alpaca_bot.gui import data_display
+from src.alpaca_bot.gui.data_display import DataDisplay
+from src.alpaca_bot.models.stock import StockBar
+
+np = pytest.importorskip("numpy")
+
+pytestmark = pytest.mark.skipif(
+    not data_display.MATPLOTLIB_AVAILABLE, reason="matplotlib is not installed"
+)
+
+START = datetime(2024, 1, 2, 9, 30)
+
+
+def make_bars(closes, start=0):
+    """Build one-minute bars with the given closes."""
+    return [
+        StockBar("AAPL", START + timedelta(minutes=start + i), close, close + 1, close - 1, close, 1000)
+        for i, close in enumerate(closes)
+    ]
+
+
+@pytest.fixture
+def display():
+    """A DataDisplay with only the chart caches set up, no Tk widgets."""
+    display = DataDisplay.__new__(DataDisplay)
+    display.logger = logging.getLogger(__name__)
+    display.price_arrays = {}
+    return display
+
+
+class TestBarArrays:
+    """Test cases for the per-symbol chart column cache."""
+    
+    def test_same_list_is_converted_once(self, display):
+        """Test that an unchanged list reuses the cached arrays."""
+        bars = make_bars([100.0, 101.0, 102.0])
+        
+        first = display._bar_arrays("AAPL", bars)
+        
+        assert display._bar_arrays("AAPL", bars)[1] is first[1]
+        assert list(first[1]) == [100.0, 101.0, 102.0]
+    
+    def test_rolling_list_is_reconverted(self, display):
+        """Test that a fixed-size list updated in place is not served stale."""
+        bars = make_bars([100.0, 101.0, 102.0])
+        display._bar_arrays("AAPL", bars)
+        
+        bars.pop(0)
+        bars.extend(make_bars([110.0], start=3))
+        
+        assert list(display._bar_arrays("AAPL", bars)[1]) == [101.0, 102.0, 110.0]
+    
+    def test_replaced_last_bar_is_reconverted(self, display):
+        """Test that updating the current bar in place refreshes the arrays."""
+        bars = make_bars([100.0, 101.0, 102.0])
+        display._bar_arrays("AAPL", bars)
+        
+        bars[-1] = make_bars([105.0], start=2)[0]
+        
+        assert list(display._bar_arrays("AAPL", bars)[1]) == [100.0, 101.0, 105.0]
+
+
+class TestMovingAverage:
+    """Test cases for the MA(20) chart indicator."""
+    
+    @pytest.fixture
+    def ma_display(self, display):
+        """A display with a real MA line to receive the indicator data."""
+        from matplotlib.lines import Line2D
+        
+        display.ma_line = Line2D([], [])
+        return display
+    
+    def test_matches_windowed_mean(self, ma_display):
+        """Test that the running-sum average equals a plain 20-bar mean."""
+        closes = np.array([100.0 + (i * 7) % 13 + i * 0.1 for i in range(45)])
+        times = np.arange(45, dtype=float)
+        
+        ma_display._add_chart_indicators(times, closes)
+        
+        expected = [closes[i - 19:i + 1].mean() for i in range(19, 45)]
+        assert list(ma_display.ma_line.get_xdata()) == list(times[19:])
+        assert np.allclose(ma_display.ma_line.get_ydata(), expected)
+    
+    def test_exactly_twenty_bars_gives_one_point(self, ma_display):
+        """Test the boundary where a single average can be computed."""
+        closes = np.arange(1.0, 21.0)
+        
+        ma_display._add_chart_indicators(np.arange(20, dtype=float), closes)
+        
+        assert list(ma_display.ma_line.get_ydata()) == [10.5]
+    
+    def test_short_history_clears_line(self, ma_display):
+        """Test that fewer than 20 bars leave the MA line empty."""
+        ma_display.ma_line.set_data([1.0], [1.0])
+        
+        ma_display._add_chart_indicators(np.arange(19, dtype=float), np.ones(19))
+        
+        assert len(ma_display.ma_line.get_xdata()) == 0
@@ -0,0 +1,56 @@
+"""Tests for error count bookkeeping in ErrorHandler."""
+
+from unittest.mock import Mock
+
+from src.alpaca_bot.utils.error_handler import ErrorHandler
+
+
+def make_handler(operations):
+    """Build an ErrorHandler with an open circuit breaker for each operation."""
+    handler = ErrorHandler(logger=Mock())
+    for operation in operations:
+        for _ in range(handler.circuit_breaker_threshold):
+            handler._increment_error_count(operation)
+    return handler
+
+
+class TestResetErrorCountsMany:
+    """Test cases for ErrorHandler.reset_error_counts_many."""
+    
+    def test_resets_only_given_operations(self):
+        """Test that listed operations are cleared and others are kept."""
+        handler = make_handler(["quotes", "orders", "bars"])
+        
+        handler.reset_error_counts_many(["quotes", "orders"])
+        
+        assert set(handler.error_counts) == {"bars"}
+        assert set(handler.last_error_times) == {"bars"}
+        assert set(handler.circuit_breakers) == {"bars"}
+        assert not handler.is_circuit_breaker_open("quotes")
+        assert handler.is_circuit_breaker_open("bars")
+    
+    def test_unknown_operations_are_ignored(self):
+        """Test that resetting operations without errors does not raise."""
+        handler = make_handler(["quotes"])
+        
+        handler.reset_error_counts_many(["missing", "quotes"])
+        
+        assert handler.error_counts == {}
+    
+    def test_logs_once_and_accepts_generators(self):
+        """Test that one summary line is logged and any iterable is accepted."""
+        handler = make_handler(["quotes", "orders"])
+        handler.logger.reset_mock()
+        
+        handler.reset_error_counts_many(op for op in ("quotes", "orders"))
+        
+        handler.logger.info.assert_called_once_with("Error counts reset for %s", "quotes, orders")
+        assert handler.error_counts == {}
+    
+    def test_empty_iterable_logs_nothing(self):
+        """Test that an empty reset is silent."""
+        handler = make_handler([])
+        
+        handler.reset_error_counts_many([])
+        
+        handler.logger.info.assert_not_called()
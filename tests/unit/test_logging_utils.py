@@ -0,0 +1,61 @@
+"""Tests for logging setup."""
+
+import logging
+import logging.handlers
+
+import pytest
+from src.alpaca_bot.utils import logging_utils
+
+
+@pytest.fixture
+def root_logger(monkeypatch):
+    """Restore the root logger's handlers and level after each test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    monkeypatch.setattr(logging_utils, "_logging_config", None)
+    yield root
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def file_handlers(root):
+    """Get the rotating file handlers attached to a logger."""
+    return [h for h in root.handlers if isinstance(h, logging.handlers.RotatingFileHandler)]
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+    
+    def test_repeated_call_keeps_handlers(self, root_logger, tmp_path):
+        """Test that a call with unchanged arguments is a no-op."""
+        log_file = str(tmp_path / "bot.log")
+        logging_utils.setup_logging("INFO", log_file)
+        handlers = root_logger.handlers[:]
+        
+        logging_utils.setup_logging("INFO", log_file)
+        
+        assert root_logger.handlers == handlers
+    
+    @pytest.mark.parametrize("changes", [
+        {"log_level": "DEBUG"},
+        {"max_file_size": 1024},
+        {"backup_count": 2},
+    ])
+    def test_changed_arguments_rebuild_handlers(self, root_logger, tmp_path, changes):
+        """Test that a different level or rotation setting is applied."""
+        args = {"log_level": "INFO", "log_file": str(tmp_path / "bot.log"),
+                "max_file_size": 4096, "backup_count": 5}
+        logging_utils.setup_logging(**args)
+        old_handler, = file_handlers(root_logger)
+        
+        logging_utils.setup_logging(**{**args, **changes})
+        
+        handler, = file_handlers(root_logger)
+        assert handler is not old_handler
+        assert handler.maxBytes == changes.get("max_file_size", 4096)
+        assert handler.backupCount == changes.get("backup_count", 5)
+        assert root_logger.level == getattr(logging, changes.get("log_level", "INFO"))
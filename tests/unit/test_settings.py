@@ -0,0 +1,289 @@
+"""Tests for loading and saving settings."""
+
+import stat
+
+import pytest
+from dotenv import dotenv_values
+from src.alpaca_bot.config import settings as settings_module
+from src.alpaca_bot.config.settings import Settings, _get, _quote_env_value, _to_bool
+
+
+REQUIRED = "ALPACA_API_KEY=key\nALPACA_SECRET_KEY=secret\n"
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point settings at a temporary project root and return its .env path."""
+    monkeypatch.setattr(settings_module, "get_project_root", lambda: tmp_path)
+    for field in Settings._FIELDS:
+        monkeypatch.delenv(field.env_key, raising=False)
+    settings_module._load_env_file_values.cache_clear()
+    yield tmp_path / ".env"
+    settings_module._load_env_file_values.cache_clear()
+
+
+def write_env(path, text):
+    """Write a .env file and drop the cached parse."""
+    path.write_text(text, encoding="utf-8")
+    settings_module._load_env_file_values.cache_clear()
+
+
+class TestToBool:
+    """Test cases for boolean parsing."""
+    
+    @pytest.mark.parametrize("raw", ["y", "yes", "t", "true", "on", "1", "True", " YES "])
+    def test_true_spellings(self, raw):
+        """Test every accepted spelling of true."""
+        assert _to_bool(raw) is True
+    
+    @pytest.mark.parametrize("raw", ["n", "no", "f", "false", "off", "0", "", "False"])
+    def test_false_spellings(self, raw):
+        """Test every accepted spelling of false."""
+        assert _to_bool(raw) is False
+    
+    def test_invalid_value_raises(self):
+        """Test that an unrecognised value is rejected."""
+        with pytest.raises(ValueError):
+            _to_bool("maybe")
+
+
+class TestGet:
+    """Test cases for configuration lookups."""
+    
+    def test_environment_overrides_env_file(self, env_file, monkeypatch):
+        """Test that process environment variables win over the .env file."""
+        write_env(env_file, "TRADING_MODE=aggressive\n")
+        monkeypatch.setenv("TRADING_MODE", "ultra_safe")
+        
+        assert _get("TRADING_MODE", "conservative", str) == "ultra_safe"
+    
+    def test_environment_changes_seen_after_first_lookup(self, env_file, monkeypatch):
+        """Test that the process environment is not frozen at the first read."""
+        write_env(env_file, "TRADING_MODE=aggressive\n")
+        assert _get("TRADING_MODE", "conservative", str) == "aggressive"
+        
+        monkeypatch.setenv("TRADING_MODE", "ultra_safe")
+        assert _get("TRADING_MODE", "conservative", str) == "ultra_safe"
+    
+    def test_key_without_value_uses_default(self, env_file):
+        """Test that a key declared without a value falls back to the default."""
+        write_env(env_file, REQUIRED + "FIXED_TRADE_AMOUNT\n")
+        
+        assert _get("FIXED_TRADE_AMOUNT", 100.0, float) == 100.0
+        assert Settings().fixed_trade_amount == 100.0
+    
+    def test_bool_setting_parsed_from_env_file(self, env_file):
+        """Test that boolean settings accept the documented spellings."""
+        write_env(env_file, REQUIRED + "PAPER_TRADING=off\n")
+        
+        assert Settings().paper_trading is False
+    
+    def test_invalid_bool_setting_raises(self, env_file):
+        """Test that an invalid boolean in the .env file is rejected."""
+        write_env(env_file, REQUIRED + "PAPER_TRADING=sometimes\n")
+        
+        with pytest.raises(ValueError):
+            Settings()
+
+
+class TestSaveToEnvFile:
+    """Test cases for writing settings back to the .env file."""
+    
+    def test_round_trip_keeps_other_settings(self, env_file):
+        """Test that saved values reload and unrelated keys are preserved."""
+        write_env(env_file, REQUIRED + "STOP_LOSS_PERCENTAGE=0.05\nCUSTOM_FLAG=abc\n")
+        settings = Settings()
+        settings.stop_loss_percentage = 0.03
+        settings.fixed_trade_amount_enabled = True
+        
+        assert settings.save_to_env_file() is True
+        
+        content = env_file.read_text(encoding="utf-8")
+        assert "# Other Settings\nCUSTOM_FLAG=abc\n" in content
+        assert "FIXED_TRADE_AMOUNT_ENABLED=true\n" in content
+        assert not env_file.with_name(".env.tmp").exists()
+        
+        reloaded = Settings()
+        assert reloaded.stop_loss_percentage == 0.03
+        assert reloaded.fixed_trade_amount_enabled is True
+        assert reloaded.alpaca_api_key == "key"
+    
+    def test_round_trip_keeps_quoted_and_interpolated_values(self, env_file):
+        """Test that values needing quotes or holding ${VAR} are written back verbatim."""
+        write_env(
+            env_file,
+            REQUIRED
+            + 'WEBHOOK_NOTE="alerts #trading"\n'
+            + "PATH_X=${HOME}/x\n"
+            + "QUOTES='it\\'s \"quoted\" \\\\ here'\n",
+        )
+        settings = Settings()
+        
+        assert settings.save_to_env_file() is True
+        
+        values = dotenv_values(env_file, interpolate=False)
+        assert values["WEBHOOK_NOTE"] == "alerts #trading"
+        assert values["PATH_X"] == "${HOME}/x"
+        assert values["QUOTES"] == 'it\'s "quoted" \\ here'
+    
+    @pytest.mark.parametrize("value", ["", "plain", "two words", "a#b", "x'y", 'x"y', "a\\b", "$1"])
+    def test_quoted_values_parse_back(self, tmp_path, value):
+        """Test that _quote_env_value output parses back to the same value."""
+        path = tmp_path / ".env"
+        path.write_text(f"KEY={_quote_env_value(value)}\n", encoding="utf-8")
+        
+        assert dotenv_values(path, interpolate=False)["KEY"] == value
+    
+    @pytest.mark.parametrize("mode", [0o600, 0o640])
+    def test_save_preserves_file_mode(self, env_file, mode):
+        """Test that saving keeps the permissions of the existing file."""
+        write_env(env_file, REQUIRED)
+        env_file.chmod(mode)
+        settings = Settings()
+        settings.trading_mode = "aggressive"
+        
+        assert settings.save_to_env_file() is True
+        assert stat.S_IMODE(env_file.stat().st_mode) == mode
+    
+    def test_new_file_is_owner_only(self, env_file):
+        """Test that a newly created .env file is not readable by others."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        new_file = env_file.with_name("new.env")
+        
+        assert settings.save_to_env_file(str(new_file)) is True
+        assert stat.S_IMODE(new_file.stat().st_mode) == 0o600
+    
+    def test_save_writes_through_symlink(self, env_file):
+        """Test that a symlinked .env stays a link and its target is updated."""
+        target = env_file.with_name("real.env")
+        target.write_text(REQUIRED, encoding="utf-8")
+        env_file.symlink_to(target)
+        settings_module._load_env_file_values.cache_clear()
+        settings = Settings()
+        settings.trading_mode = "aggressive"
+        
+        assert settings.save_to_env_file() is True
+        assert env_file.is_symlink()
+        assert "TRADING_MODE=aggressive\n" in target.read_text(encoding="utf-8")
+    
+    def test_saves_given_values(self, env_file):
+        """Test that a values snapshot is written instead of current settings."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        values = settings.env_file_values()
+        settings.trading_mode = "aggressive"
+        
+        assert settings.save_to_env_file(values=values) is True
+        assert "TRADING_MODE=conservative\n" in env_file.read_text(encoding="utf-8")
+    
+    def test_undecodable_file_returns_false(self, env_file):
+        """Test that an existing file that is not UTF-8 is reported, not raised."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        env_file.write_bytes(b"ALPACA_API_KEY=\xff\xfe\n")
+        
+        assert settings.save_to_env_file() is False
+
+
+class TestStrategyParams:
+    """Test cases for the strategy parameter view."""
+    
+    def test_view_reflects_attribute_assignment(self, env_file):
+        """Test that plain attribute assignment shows up in the view."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        params = settings.get_strategy_params()
+        
+        settings.stop_loss_percentage = 0.05
+        
+        assert params["stop_loss_percentage"] == 0.05
+        assert settings.get_strategy_params()["stop_loss_percentage"] == 0.05
+    
+    def test_view_is_read_only(self, env_file):
+        """Test that the view lists the parameters and rejects writes."""
+        write_env(env_file, REQUIRED)
+        params = Settings().get_strategy_params()
+        
+        assert dict(params) == {
+            "support_threshold": 0.02,
+            "resistance_threshold": 0.015,
+            "stop_loss_percentage": 0.01,
+            "default_position_size": 1000.0,
+        }
+        with pytest.raises(TypeError):
+            params["stop_loss_percentage"] = 0.5
+        with pytest.raises(KeyError):
+            params["alpaca_secret_key"]
+    
+    def test_update_rejects_whole_call(self, env_file):
+        """Test that one invalid parameter leaves the others unapplied."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        
+        with pytest.raises(ValueError):
+            settings.update_strategy_params(stop_loss_percentage=0.02, support_threshold=5)
+        
+        assert settings.stop_loss_percentage == 0.01
+        assert settings.support_threshold == 0.02
+    
+    def test_update_applies_valid_params(self, env_file):
+        """Test that valid parameters are applied and visible in the view."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        
+        settings.update_strategy_params(stop_loss_percentage=0.02, default_position_size=500.0)
+        
+        assert settings.get_strategy_params()["stop_loss_percentage"] == 0.02
+        assert settings.default_position_size == 500.0
+
+
+class TestCredentials:
+    """Test cases for the Alpaca credentials accessor."""
+    
+    def test_credentials_reflect_attribute_assignment(self, env_file):
+        """Test that changed credentials are returned, not a stale copy."""
+        write_env(env_file, REQUIRED)
+        settings = Settings()
+        
+        settings.alpaca_api_key = "new-key"
+        
+        assert settings.get_alpaca_credentials() == (
+            "new-key", "secret", "https://paper-api.alpaca.markets"
+        )
+
+
+class TestReload:
+    """Test cases for reloading settings."""
+    
+    def test_reload_picks_up_changed_file(self, env_file):
+        """Test that reload() applies values from a changed .env file."""
+        write_env(env_file, REQUIRED + "STOP_LOSS_PERCENTAGE=0.05\n")
+        settings = Settings()
+        params = settings.get_strategy_params()
+        
+        env_file.write_text(REQUIRED + "STOP_LOSS_PERCENTAGE=0.02\n", encoding="utf-8")
+        settings.reload()
+        
+        assert settings.stop_loss_percentage == 0.02
+        assert params["stop_loss_percentage"] == 0.02
+    
+    @pytest.mark.parametrize("bad_line", [
+        "STOP_LOSS_PERCENTAGE=1.5\n",
+        "DEFAULT_POSITION_SIZE=lots\n",
+    ])
+    def test_reload_keeps_settings_when_invalid(self, env_file, bad_line):
+        """Test that a failed reload() leaves the instance unchanged."""
+        write_env(env_file, REQUIRED + "STOP_LOSS_PERCENTAGE=0.05\nTRADING_MODE=aggressive\n")
+        settings = Settings()
+        
+        env_file.write_text(
+            REQUIRED + "TRADING_MODE=ultra_safe\n" + bad_line, encoding="utf-8"
+        )
+        with pytest.raises(ValueError):
+            settings.reload()
+        
+        assert settings.stop_loss_percentage == 0.05
+        assert settings.trading_mode == "aggressive"
+        assert settings.default_position_size == 1000.0
+        assert settings.get_strategy_params()["stop_loss_percentage"] == 0.05